@@ -0,0 +1,346 @@
+"""Module for running the Advent of Code 2025 solutions of one or more days in one process."""
+
+import argparse
+import importlib
+import logging
+import os
+import tracemalloc
+
+from concurrent.futures import ProcessPoolExecutor
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+
+import instrumentation
+
+from cache import ParseCache, ResultStore, hash_input
+from instrumentation import annotate, format_summary, setup_instrumentation, span
+from loader import load_puzzle_input
+from log import setup_logging
+from profiler import profile
+
+
+@dataclass(frozen=True)
+class Part:
+    """Solver of one part of a day, with the names of its arguments and fixed parameters."""
+    solver: str
+    arguments: tuple
+    params: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    """Module of a day, the parsers that prepare its input and the solvers of its parts.
+
+    If BOTH is given, it is a solver that returns the answers of both parts from a single pass,
+    which is used instead of the solvers of the parts when both parts are solved together.
+    """
+    module: str
+    parsers: dict
+    parts: dict
+    heavy: bool = False
+    both: Part = None
+
+
+# Registry of the solvers of each day. Everything is referred to by name, so a module (and
+# the heavy libraries it imports) is only imported once a solver of that day is needed.
+# The raw puzzle input is always available as the argument "input".
+PUZZLES = {
+    1: Puzzle(
+        module="day1",
+        parsers={"rotations": "convert_input_to_rotations"},
+        parts={
+            1: Part("solve_day_one_part_one_vectorized", ("rotations",), {"starting_value": 50}),
+            2: Part("solve_day_one_part_two_vectorized", ("rotations",), {"starting_value": 50}),
+        },
+        both=Part("count_dial_zeros", ("rotations",), {"starting_value": 50}),
+    ),
+    2: Puzzle(
+        module="day2",
+        parsers={},
+        parts={
+            1: Part("solve_day_two_part_one_parallel", ("input",)),
+            2: Part("solve_day_two_part_two_parallel", ("input",)),
+        },
+    ),
+    3: Puzzle(
+        module="day3",
+        parsers={"banks": "transform_input_into_banks"},
+        parts={
+            1: Part("solve_day_three_parallel", ("banks",), {"n_choose": 2}),
+            2: Part("solve_day_three_parallel", ("banks",), {"n_choose": 12}),
+        },
+    ),
+    4: Puzzle(
+        module="day4",
+        heavy=True,
+        parsers={"grid": "transform_input_into_grid"},
+        parts={
+            1: Part("solve_day_four_part_one", ("grid",)),
+            2: Part("peel_rolls", ("grid",)),
+        },
+    ),
+    5: Puzzle(
+        module="day5",
+        heavy=True,
+        parsers={"ingredients_list": "get_ingredient_list", "fresh_ingredients": "get_fresh_ingredients"},
+        parts={
+            1: Part("solve_day_five_part_one", ("ingredients_list", "fresh_ingredients")),
+            2: Part("solve_day_five_part_two", ("fresh_ingredients",)),
+        },
+    ),
+    6: Puzzle(
+        module="day6",
+        heavy=True,
+        parsers={"matrix": "transform_input_into_matrix"},
+        parts={
+            1: Part("solve_day_six_part_one_vectorized", ("matrix",)),
+            2: Part("solve_day_six_part_two_vectorized", ("matrix",)),
+        },
+    ),
+    7: Puzzle(
+        module="day7",
+        parsers={"index": "SplitterIndex"},
+        parts={
+            1: Part("solve_day_seven_part_one_indexed", ("index",)),
+            2: Part("solve_day_seven_part_two_indexed", ("index",)),
+        },
+        both=Part("simulate_beams", ("index",)),
+    ),
+}
+
+
+def get_puzzle(day: int) -> Puzzle:
+    """Look up the registry entry of a day."""
+    if day not in PUZZLES:
+        raise ValueError(f"No solutions registered for day {day}.")
+    return PUZZLES[day]
+
+
+def import_day(day: int) -> tuple:
+    """Look up the registry entry of a day and import its module."""
+    puzzle = get_puzzle(day)
+    return puzzle, importlib.import_module(puzzle.module)
+
+
+def parse_puzzle_input(puzzle: Puzzle, module, input, parts: list = (1, 2), cache: ParseCache = None) -> dict:
+    """Run the parsers whose results are needed by the requested parts, or load them from a CACHE."""
+    arguments = {"input": input}
+    needed = {a for part in parts for a in puzzle.parts[part].arguments}
+    parsers = [(name, parser) for name, parser in puzzle.parsers.items() if name in needed]
+    if cache is None or not parsers:
+        for name, parser in parsers:
+            arguments[name] = getattr(module, parser)(input)
+        return arguments
+
+    # Only parse on a cache miss, and report whether all parsed values came from the cache
+    input_digest = hash_input(input)
+    hit = True
+    for name, parser in parsers:
+        arguments[name] = cache.load(module, parser, input_digest)
+        if arguments[name] is None:
+            hit = False
+            arguments[name] = getattr(module, parser)(input)
+            cache.store(module, parser, input_digest, arguments[name])
+    annotate(parse_cache="hit" if hit else "miss")
+    return arguments
+
+
+def call_solver(spec: Part, module, arguments: dict):
+    """Call the solver of a registry entry on the parsed puzzle input."""
+    solver = getattr(module, spec.solver)
+    return solver(**{a: arguments[a] for a in spec.arguments}, **spec.params)
+
+
+def solve_part(puzzle: Puzzle, module, arguments: dict, part: int):
+    """Solve one part of a day on the parsed puzzle input."""
+    return call_solver(puzzle.parts[part], module, arguments)
+
+
+def look_up_answers(puzzle: Puzzle, day: int, parts: list, file_path: str, results: ResultStore) -> tuple:
+    """Look up the stored answers of the requested parts, and return them with the digest of the input.
+
+    The raw input is hashed without importing the module of the day, so stored answers are found
+    without importing any heavy libraries.
+    """
+    # Input from stdin can only be read once, so its answers are not looked up or stored
+    if results is None or file_path == "-":
+        return {}, None
+
+    input_digest = hash_input(load_puzzle_input(day, file_path))
+    answers = {}
+    for part in parts:
+        with span("lookup", day=day, part=part) as lookup_span:
+            spec = puzzle.parts[part]
+            answer = results.load(results.key(puzzle.module, spec.solver, spec.params, input_digest))
+            lookup_span.set(result_store="bypass" if results.recompute else "miss" if answer is None else "hit")
+        if answer is not None:
+            answers[part] = answer
+    return answers, input_digest
+
+
+def store_answer(puzzle: Puzzle, day: int, part: int, input_digest: str, answer, results: ResultStore):
+    """Store the answer of a part, if it was looked up before."""
+    if input_digest is not None:
+        spec = puzzle.parts[part]
+        results.store(results.key(puzzle.module, spec.solver, spec.params, input_digest), day, part, answer)
+
+
+def solve_day(day: int, parts: list = (1, 2), file_path: str = None, profile_dir: str = None, profiler: str = "sample", cache: ParseCache = None, results: ResultStore = None) -> dict:
+    """Solve the requested parts of a day, reading and parsing its puzzle input only once.
+
+    If a PROFILE_DIR is given, the parsing and each part are profiled into separate files.
+    If a CACHE is given, the parsed input is loaded from it if the same input was parsed before.
+    If a RESULTS store is given, the answers are looked up in it if they were solved before.
+    """
+    puzzle = get_puzzle(day)
+    solutions, input_digest = look_up_answers(puzzle, day, parts, file_path, results)
+    for part in solutions:
+        logging.info(f"Day {day}: looked up part {part}! The answer is: {solutions[part]}.")
+
+    # Only read and parse the input if any of the parts is left to solve
+    parts = [part for part in parts if part not in solutions]
+    if not parts:
+        return solutions
+    module = importlib.import_module(puzzle.module)
+
+    def profiled(name: str):
+        if profile_dir is None:
+            return nullcontext()
+        return profile(os.path.join(profile_dir, f"day{day}_{name}"), profiler)
+
+    with span("read", day=day):
+        input = module.read_puzzle_input(file_path)
+    logging.info(f"Day {day}: read puzzle input.")
+
+    with span("parse", day=day), profiled("parse"):
+        arguments = parse_puzzle_input(puzzle, module, input, parts, cache)
+    logging.info(f"Day {day}: parsed puzzle input.")
+
+    # Solve both parts in a single pass if the day has a solver for that
+    if puzzle.both is not None and sorted(parts) == [1, 2]:
+        with span("solve", day=day, part="1+2"), profiled("parts"):
+            answers = call_solver(puzzle.both, module, arguments)
+        for part, answer in zip([1, 2], answers):
+            solutions[part] = answer
+            store_answer(puzzle, day, part, input_digest, answer, results)
+            logging.info(f"Day {day}: solved part {part}! The answer is: {answer}.")
+        return solutions
+
+    for part in parts:
+        with span("solve", day=day, part=part), profiled(f"part{part}"):
+            solutions[part] = solve_part(puzzle, module, arguments, part)
+        store_answer(puzzle, day, part, input_digest, solutions[part], results)
+        logging.info(f"Day {day}: solved part {part}! The answer is: {solutions[part]}.")
+
+    return solutions
+
+
+def solve_job(day: int, part: int, file_path: str = None, memory: bool = False, cache: ParseCache = None, results: ResultStore = None) -> dict:
+    """Solve a single part of a day, e.g. in a worker process, and return its answer and timings."""
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    first_record = len(instrumentation.records)
+    puzzle = get_puzzle(day)
+    answers, input_digest = look_up_answers(puzzle, day, [part], file_path, results)
+    if part in answers:
+        return {"answer": answers[part], "spans": instrumentation.records[first_record:]}
+
+    module = importlib.import_module(puzzle.module)
+    with span("read", day=day, part=part):
+        input = module.read_puzzle_input(file_path)
+    with span("parse", day=day, part=part):
+        arguments = parse_puzzle_input(puzzle, module, input, [part], cache)
+    with span("solve", day=day, part=part):
+        answer = solve_part(puzzle, module, arguments, part)
+    store_answer(puzzle, day, part, input_digest, answer, results)
+
+    return {"answer": answer, "spans": instrumentation.records[first_record:]}
+
+
+def solve_jobs_in_parallel(jobs: list, max_workers: int = None, memory: bool = False, cache: ParseCache = None, results: ResultStore = None) -> dict:
+    """Solve (day, part, file path) jobs in a process pool and gather the results in a fixed order."""
+    # Start with the days that import the heavy libraries and take longest, so they do not hold up
+    # the end of the batch. Within a group, keep the order of the days and parts.
+    jobs = sorted(jobs, key=lambda job: (not PUZZLES[job[0]].heavy, job[0], job[1]))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            (day, part): executor.submit(solve_job, day, part, file_path, memory, cache, results)
+            for day, part, file_path in jobs
+        }
+        return {key: futures[key].result() for key in sorted(futures)}
+
+
+def main(argv: list = None):
+    """Entry point of code."""
+    parser = argparse.ArgumentParser(prog="aoc", description="Run Advent of Code 2025 solutions.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="solve one or more days")
+    run_parser.add_argument("--day", type=int, nargs="+", default=sorted(PUZZLES), help="day(s) to solve")
+    run_parser.add_argument("--part", type=int, nargs="+", choices=[1, 2], default=[1, 2], help="part(s) to solve")
+    run_parser.add_argument("--input", help="puzzle input file or - for stdin, only allowed when solving a single day")
+    run_parser.add_argument("--input-dir", help="directory with a dayN.txt file per day (default: ../inputs)")
+    run_parser.add_argument("--trace", nargs="?", const="-", help="write timings as JSON lines to a file or - for stderr")
+    run_parser.add_argument("--trace-memory", action="store_true", help="also trace peak memory per phase")
+    run_parser.add_argument("--summary", action="store_true", help="print a table of the timings per phase")
+    run_parser.add_argument("--profile", nargs="?", const="profiles", help="write a profile per day and part to a directory")
+    run_parser.add_argument("--profiler", choices=["sample", "cprofile"], default="sample", help="profiling mode")
+    run_parser.add_argument("--jobs", type=int, default=1, help="solve every day and part in a pool of this many processes")
+    run_parser.add_argument("--no-cache", action="store_true", help="always parse the puzzle input instead of using the parse cache")
+    run_parser.add_argument("--no-results", action="store_true", help="neither look up nor store answers in the result store")
+    run_parser.add_argument("--recompute", action="store_true", help="solve again instead of looking up stored answers, and store the new answers")
+
+    cache_parser = subparsers.add_parser("cache", help="manage the cache of parsed puzzle input and answers")
+    cache_parser.add_argument("action", choices=["clear"], help="action to perform on the cache")
+    cache_parser.add_argument("--day", type=int, help="only clear the entries of this day")
+
+    args = parser.parse_args(argv)
+    if args.command == "cache":
+        setup_logging()
+        n_removed = ParseCache().clear(args.day)
+        logging.info(f"Removed {n_removed} entries from the parse cache.")
+        n_removed = ResultStore().clear(args.day)
+        logging.info(f"Removed {n_removed} answers from the result store.")
+        return
+
+    if args.input is not None and len(args.day) > 1:
+        parser.error("--input can only be used when solving a single day")
+    if args.jobs > 1 and args.profile is not None:
+        parser.error("--profile cannot be combined with --jobs")
+    if args.jobs > 1 and args.input == "-":
+        parser.error("--input - cannot be combined with --jobs, stdin can only be read by one process")
+
+    setup_logging()
+    if args.trace is not None or args.trace_memory:
+        setup_instrumentation(args.trace, memory=args.trace_memory)
+    logging.info("Start of script.")
+    cache = None if args.no_cache else ParseCache()
+    results = None if args.no_results else ResultStore(recompute=args.recompute)
+
+    file_paths = {}
+    for day in args.day:
+        file_paths[day] = args.input
+        if args.input is None and args.input_dir is not None:
+            file_paths[day] = os.path.join(args.input_dir, f"day{day}.txt")
+
+    if args.jobs > 1:
+        jobs = [(day, part, file_paths[day]) for day in args.day for part in args.part]
+        solved_jobs = solve_jobs_in_parallel(jobs, args.jobs, memory=args.trace_memory, cache=cache, results=results)
+        for (day, part), solved_job in solved_jobs.items():
+            for record in solved_job["spans"]:
+                instrumentation.emit(record)
+            logging.info(f"Day {day}: solved part {part}! The answer is: {solved_job['answer']}.")
+    else:
+        for day in args.day:
+            solve_day(day, args.part, file_paths[day], args.profile, args.profiler, cache, results)
+
+    if args.summary:
+        print(format_summary())
+    logging.info("End of script.")
+
+
+if __name__ == "__main__":
+    main()
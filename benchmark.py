@@ -0,0 +1,166 @@
+"""Module for benchmarking the solutions on synthetic puzzle input of increasing size."""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+from datetime import datetime, timezone
+
+from aoc import PUZZLES, import_day, parse_puzzle_input, solve_part
+from generators import GENERATORS, count_items
+from log import setup_logging
+
+
+# Sizes per day, in the unit of the generator of that day
+DEFAULT_SCALES = {
+    1: [10**4, 10**5, 10**6],
+    2: [10**2, 10**3, 10**4],
+    3: [10**3, 10**4, 10**5],
+    4: [100, 300, 1000],
+    5: [10**3, 10**4, 10**5],
+    6: [10**3, 10**4, 10**5],
+    7: [10**3, 10**4, 10**5],
+}
+
+
+def time_call(function, *args, **kwargs) -> tuple:
+    """Call a function and return its result and wall time in seconds."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def measure_phases(day: int, file_path: str) -> dict:
+    """Time the read, parse and solve phases of each part of a day once."""
+    puzzle, module = import_day(day)
+    input, read_time = time_call(module.read_puzzle_input, file_path)
+    arguments, parse_time = time_call(parse_puzzle_input, puzzle, module, input)
+
+    timings = {"read": read_time, "parse": parse_time}
+    for part in puzzle.parts:
+        _, timings[f"part_{part}"] = time_call(solve_part, puzzle, module, arguments, part)
+    return timings
+
+
+def measure_peak_memory(day: int, file_path: str) -> dict:
+    """Measure the peak traced memory of the read, parse and solve phases of each part of a day."""
+    puzzle, module = import_day(day)
+    peaks = {}
+
+    tracemalloc.start()
+    try:
+        input = module.read_puzzle_input(file_path)
+        peaks["read"] = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        arguments = parse_puzzle_input(puzzle, module, input)
+        peaks["parse"] = tracemalloc.get_traced_memory()[1]
+
+        for part in puzzle.parts:
+            tracemalloc.reset_peak()
+            solve_part(puzzle, module, arguments, part)
+            peaks[f"part_{part}"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def benchmark_day(day: int, scale: int, seed: int = 0, repeat: int = 3, memory: bool = False) -> dict:
+    """Benchmark a day on generated input of the given scale, keeping the best of REPEAT runs."""
+    input_raw = GENERATORS[day](scale, seed=seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, f"day{day}.txt")
+        with open(file_path, "wb") as file:
+            file.write(input_raw)
+
+        runs = [measure_phases(day, file_path) for _ in range(repeat)]
+        timings = {phase: min(run[phase] for run in runs) for phase in runs[0]}
+        peaks = measure_peak_memory(day, file_path) if memory else None
+
+    # Throughput is reported in input bytes and generated items per second of solving
+    n_items = count_items(day, scale)
+    result = {"day": day, "scale": scale, "seed": seed, "input_bytes": len(input_raw), "items": n_items, "phases": {}}
+    for phase, seconds in timings.items():
+        result["phases"][phase] = {
+            "seconds": seconds,
+            "megabytes_per_second": len(input_raw) / seconds / 1e6 if seconds > 0 else None,
+            "items_per_second": n_items / seconds if seconds > 0 else None,
+            "peak_memory_bytes": peaks[phase] if peaks is not None else None,
+        }
+    return result
+
+
+def summarise(results: list) -> str:
+    """Format benchmark results as a table."""
+    lines = [f"{'day':>3} {'scale':>10} {'phase':>7} {'seconds':>10} {'MB/s':>10} {'items/s':>12} {'peak MB':>9}"]
+    for result in results:
+        for phase, values in result["phases"].items():
+            peak = values["peak_memory_bytes"]
+            lines.append(
+                f"{result['day']:>3} {result['scale']:>10} {phase:>7} {values['seconds']:>10.4f} "
+                f"{values['megabytes_per_second'] or 0:>10.1f} {values['items_per_second'] or 0:>12.0f} "
+                f"{'' if peak is None else f'{peak / 1e6:.1f}':>9}"
+            )
+    return "\n".join(lines)
+
+
+def compare(results: list, previous: list) -> str:
+    """Format the speed-up of each phase relative to a previous benchmark run."""
+    previous = {(r["day"], r["scale"], phase): v["seconds"] for r in previous for phase, v in r["phases"].items()}
+    lines = [f"{'day':>3} {'scale':>10} {'phase':>7} {'before':>10} {'after':>10} {'speed-up':>9}"]
+    for result in results:
+        for phase, values in result["phases"].items():
+            before = previous.get((result["day"], result["scale"], phase))
+            if before is None:
+                continue
+            after = values["seconds"]
+            lines.append(f"{result['day']:>3} {result['scale']:>10} {phase:>7} {before:>10.4f} {after:>10.4f} {before / after:>8.2f}x")
+    return "\n".join(lines)
+
+
+def main(argv: list = None):
+    """Entry point of code."""
+    parser = argparse.ArgumentParser(description="Benchmark the solutions on synthetic puzzle input.")
+    parser.add_argument("--day", type=int, nargs="+", default=sorted(PUZZLES), help="day(s) to benchmark")
+    parser.add_argument("--scale", type=int, nargs="+", help="input size(s), defaults to a range per day")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the input generators")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs per size, the best is kept")
+    parser.add_argument("--memory", action="store_true", help="also measure peak memory with tracemalloc")
+    parser.add_argument("--output", help="JSON file to save the results to")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare the results with")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    results = []
+    for day in args.day:
+        for scale in args.scale or DEFAULT_SCALES[day]:
+            logging.info(f"Benchmarking day {day} at scale {scale}.")
+            results.append(benchmark_day(day, scale, args.seed, args.repeat, args.memory))
+
+    print(summarise(results))
+
+    if args.compare is not None:
+        with open(args.compare, "r") as file:
+            print(compare(results, json.load(file)["results"]))
+
+    if args.output is not None:
+        metadata = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        }
+        with open(args.output, "w") as file:
+            json.dump({"metadata": metadata, "results": results}, file, indent=2)
+        logging.info(f"Saved benchmark results to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Module for caching parsed puzzle input and answers on disk, keyed by the content of the input and the code."""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from contextlib import closing
+
+import loader
+
+
+# Parsed input is cached per user, unless another directory is given through the environment
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "aoc2025")
+DEFAULT_MAX_BYTES = 2**30
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def get_cache_dir() -> str:
+    """Find the directory of the cache."""
+    return os.environ.get("AOC_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def hash_input(input) -> str:
+    """Hash the raw puzzle input, e.g. a memory-mapped file or a list of lines."""
+    if not isinstance(input, (list, tuple)):
+        return hashlib.blake2b(input, digest_size=16).hexdigest()
+
+    digest = hashlib.blake2b(digest_size=16)
+    for x in input:
+        digest.update(x.encode() if isinstance(x, str) else bytes(x))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_source(*objects) -> str:
+    """Hash the source code of modules, classes or functions, so a change to them gives a new hash."""
+    digest = hashlib.blake2b(digest_size=16)
+    for x in objects:
+        digest.update(inspect.getsource(x).encode())
+    return digest.hexdigest()
+
+
+def hash_module_source(name: str) -> str:
+    """Hash the source file of a module without importing it, e.g. to avoid importing heavy libraries."""
+    with open(importlib.util.find_spec(name).origin, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def pack(value) -> tuple:
+    """Convert a parsed value into a type name and named arrays, or None if it cannot be cached.
+
+    Arrays and lists of integers are cached as they are. Other types can be cached by implementing
+    a to_arrays method and a from_arrays class method.
+    """
+    # A value can only be an array if NumPy was imported, keep it out of the import of this module
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return "ndarray", {"value": value}
+    if hasattr(value, "to_arrays"):
+        return type(value).__name__, value.to_arrays()
+
+    if isinstance(value, list) and all(type(x) is int for x in value):
+        import numpy as np
+        try:
+            return "list", {"value": np.array(value, dtype=np.int64)}
+        except OverflowError:
+            return None
+    return None
+
+
+def unpack(module, type_name: str, arrays: dict):
+    """Convert a type name and named arrays back into a parsed value of a day module."""
+    if type_name == "ndarray":
+        return arrays["value"]
+    if type_name == "list":
+        return arrays["value"].tolist()
+    return getattr(module, type_name).from_arrays(arrays)
+
+
+class ParseCache:
+    """Directory of parsed puzzle input as .npy files that are memory-mapped on load.
+
+    Every entry is a directory with the arrays of one parsed value. The least recently used
+    entries are removed once the entries take up more than MAX_BYTES.
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Create a cache in a directory, by default the cache directory of the user."""
+        self.directory = os.path.join(directory or get_cache_dir(), "parse")
+        self.max_bytes = max_bytes
+
+    def entry_path(self, module, parser: str, input_digest: str) -> str:
+        """Path of the entry of a parser of a day module on the input with the given digest."""
+        # Any change to the day module or the loader gives a new parser version
+        version = hash_source(module, loader)
+        key = hashlib.blake2b(f"{input_digest}:{version}".encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{module.__name__}-{parser}-{key}")
+
+    def load(self, module, parser: str, input_digest: str):
+        """Load a parsed value from the cache, or return None if it is not cached."""
+        path = self.entry_path(module, parser, input_digest)
+        if not os.path.isdir(path):
+            return None
+
+        import numpy as np
+        try:
+            with open(os.path.join(path, "meta.json"), "r") as file:
+                meta = json.load(file)
+            arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in meta["arrays"]}
+        except (OSError, ValueError):
+            return None
+
+        # Mark the entry as recently used
+        os.utime(path)
+        return unpack(module, meta["type"], arrays)
+
+    def store(self, module, parser: str, input_digest: str, value) -> bool:
+        """Store a parsed value in the cache, and return whether it could be cached."""
+        packed = pack(value)
+        if packed is None:
+            return False
+        type_name, arrays = packed
+
+        import numpy as np
+
+        # Write the entry to a temporary directory first, so it only appears once it is complete
+        path = self.entry_path(module, parser, input_digest)
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".staging-")
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(array))
+            with open(os.path.join(staging, "meta.json"), "w") as file:
+                json.dump({"type": type_name, "arrays": list(arrays)}, file)
+            os.replace(staging, path)
+        except OSError:
+            # Another process stored the same entry in the meantime
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self.evict()
+        return True
+
+    def entries(self) -> list:
+        """List the (last used, size in bytes, path) of every entry, least recently used first."""
+        if not os.path.isdir(self.directory):
+            return []
+
+        result = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            size = sum(x.stat().st_size for x in os.scandir(entry.path))
+            result.append((entry.stat().st_mtime, size, entry.path))
+        return sorted(result)
+
+    def evict(self):
+        """Remove the least recently used entries until the entries fit in the maximum size."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self, day: int = None) -> int:
+        """Remove all entries, or only those of one day, and return the number of removed entries."""
+        entries = [path for _, _, path in self.entries()]
+        if day is not None:
+            entries = [path for path in entries if os.path.basename(path).startswith(f"day{day}-")]
+        for path in entries:
+            shutil.rmtree(path, ignore_errors=True)
+        return len(entries)
+
+
+class ResultStore:
+    """SQLite database of the answers of the solvers, keyed by their input, parameters and source.
+
+    Answers are stored as JSON, so answers that do not fit 64 bits are stored exactly. The least
+    recently used answers are removed once there are more than MAX_ENTRIES.
+    """
+
+    def __init__(self, directory: str = None, max_entries: int = DEFAULT_MAX_ENTRIES, recompute: bool = False):
+        """Create a store in a directory, by default the cache directory of the user.
+
+        If RECOMPUTE is set, no answers are looked up, but new answers are still stored.
+        """
+        self.file_path = os.path.join(directory or get_cache_dir(), "results.sqlite3")
+        self.max_entries = max_entries
+        self.recompute = recompute
+
+    def connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed."""
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        connection = sqlite3.connect(self.file_path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, day INTEGER, part INTEGER, answer TEXT, last_used REAL)"
+        )
+        return connection
+
+    def key(self, module_name: str, solver: str, params: dict, input_digest: str) -> str:
+        """Key of the answer of a solver of a day module with fixed parameters on the input with the given digest."""
+        # Any change to the day module, or to the loader and parallel modules the solvers call into,
+        # gives a new solver version
+        version = ":".join(hash_module_source(name) for name in [module_name, "loader", "parallel"])
+        fields = [module_name, version, solver, json.dumps(params, sort_keys=True), input_digest]
+        return hashlib.blake2b(":".join(fields).encode(), digest_size=16).hexdigest()
+
+    def load(self, key: str):
+        """Look up a stored answer, or return None if it is not stored."""
+        if self.recompute:
+            return None
+
+        with closing(self.connect()) as connection, connection:
+            row = connection.execute("SELECT answer FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            # Mark the answer as recently used
+            connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def store(self, key: str, day: int, part: int, answer):
+        """Store an answer, and remove the least recently used answers if there are too many."""
+        with closing(self.connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, day, part, json.dumps(answer), time.time()),
+            )
+            connection.execute(
+                "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY last_used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self, day: int = None) -> int:
+        """Remove all answers, or only those of one day, and return the number of removed answers."""
+        if not os.path.exists(self.file_path):
+            return 0
+
+        with closing(self.connect()) as connection, connection:
+            if day is None:
+                return connection.execute("DELETE FROM results").rowcount
+            return connection.execute("DELETE FROM results WHERE day = ?", (day,)).rowcount
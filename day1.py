@@ -1,20 +1,29 @@
 """Module for Advent of Code 2025: Day 1."""
 
+import argparse
+import hashlib
+import json
 import logging
 import os
+import re
 
+import numpy as np
+
+from loader import load_puzzle_text, resolve_input_path
 from log import setup_logging
 
 
-def read_puzzle_input() -> list:
-    """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day1.txt"
+# Number of bytes at the start and at the end of the checkpointed part of a log that are hashed
+CHECKPOINT_SAMPLE_BYTES = 4096
 
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.split("\n")]
+# A complete rotation, used to tell whether a last line without newline was fully written
+ROTATION = re.compile(rb"\s*[LR]\d+\s*")
+
+
+def read_puzzle_input(file_path: str = None) -> list:
+    """Read puzzle input."""
+    input_raw = load_puzzle_text(1, file_path)
+    return input_raw.split()
 
 
 def convert_input_to_rotations(input: list) -> list:
@@ -82,24 +91,214 @@ def solve_day_one_part_two(starting_value: int, rotations: list) -> int:
     return result
 
 
-def main():
+def count_dial_zeros(starting_value: int, rotations: list) -> tuple:
+    """Count the positions at zero (part 1) and the clicks through zero (part 2) in one pass."""
+    rotations = np.asarray(rotations, dtype=np.int64)
+    if rotations.size == 0:
+        return int(starting_value % 100 == 0), 0
+
+    # Calculate the positions of the dial after each rotation with a single cumulative sum.
+    # The positions before each rotation are the same positions shifted by one.
+    positions = np.cumsum(rotations)
+    positions += starting_value
+    previous = np.empty_like(positions)
+    previous[0] = starting_value
+    previous[1:] = positions[:-1]
+
+    # Part 1: check whether each position, including the starting value, is an exact multiple of 100
+    at_zero = positions % 100 == 0
+    part_one = int(np.count_nonzero(at_zero)) + int(starting_value % 100 == 0)
+
+    # Part 2: count the multiples of 100 in (previous, position] for rotations to the right
+    # and in [position, previous) for rotations to the left using floor division. This covers
+    # both the hundreds passed in between and a position ending on a multiple of 100.
+    right = positions > previous
+    left = positions < previous
+    passes_right = np.floor_divide(positions[right], 100) - np.floor_divide(previous[right], 100)
+    passes_left = np.floor_divide(previous[left] - 1, 100) - np.floor_divide(positions[left] - 1, 100)
+
+    # A rotation of zero clicks only counts if the dial rests on a multiple of 100
+    resting = np.count_nonzero(at_zero & (positions == previous))
+    part_two = int(passes_right.sum()) + int(passes_left.sum()) + int(resting)
+
+    return part_one, part_two
+
+
+def solve_day_one_part_one_vectorized(starting_value: int, rotations: list) -> int:
+    """Solve day 1 part 1 with the vectorized dial engine."""
+    return count_dial_zeros(starting_value, rotations)[0]
+
+
+def solve_day_one_part_two_vectorized(starting_value: int, rotations: list) -> int:
+    """Solve day 1 part 2 with the vectorized dial engine."""
+    return count_dial_zeros(starting_value, rotations)[1]
+
+
+def tabulate_dial_zeros(logs: list) -> tuple:
+    """Count the zeros (part 1 and part 2) of each log of rotations for every starting value from 0 to 99.
+
+    The counts only depend on the starting value modulo 100, so the counts of any starting value
+    can be looked up in the returned (number of logs, 100) tables. All logs and all starting
+    values are handled in a single pass over the rotations.
+    """
+    n_logs = len(logs)
+    lengths = np.array([len(x) for x in logs], dtype=np.int64)
+    rotations = np.concatenate([np.asarray(x, dtype=np.int64) for x in logs] + [np.zeros(0, dtype=np.int64)])
+    log_ids = np.repeat(np.arange(n_logs), lengths)
+    firsts = np.cumsum(lengths) - lengths
+
+    # Calculate the positions after each rotation relative to the starting value, with a single
+    # cumulative sum over all logs that is restarted at the first rotation of every log
+    positions = np.cumsum(rotations)
+    positions -= np.append(0, positions)[firsts][log_ids]
+    previous = positions - rotations
+
+    # Part 1: for starting value S, the dial is at a multiple of 100 after a rotation if S is
+    # congruent to minus its relative position. The starting value itself counts if it is 0.
+    at_zero = (-positions) % 100
+    part_one = np.bincount(log_ids * 100 + at_zero, minlength=n_logs * 100).reshape(n_logs, 100)
+    part_one[:, 0] += 1
+
+    # Part 2: count the multiples of 100 in (previous, position] for rotations to the right and
+    # in [position, previous) for rotations to the left, as the difference of the floor division
+    # of an upper bound X and a lower bound Y. With S = 100 * Q + R and X = 100 * A + B, the floor
+    # division of S + X is Q + A + 1 if R >= 100 - B, else Q + A. So every rotation adds a constant
+    # A(X) - A(Y) plus a step up at R = 100 - B(X) and a step down at R = 100 - B(Y).
+    right = positions > previous
+    upper = np.where(right, positions, previous - 1)
+    lower = np.where(right, previous, positions - 1)
+    moving = positions != previous
+
+    constant = np.where(moving, upper // 100 - lower // 100, 0)
+    constant = np.append(0, np.cumsum(constant))
+    constant = constant[firsts + lengths] - constant[firsts]
+
+    ids = log_ids[moving] * 101
+    steps = np.bincount(ids + 100 - upper[moving] % 100, minlength=n_logs * 101)
+    steps -= np.bincount(ids + 100 - lower[moving] % 100, minlength=n_logs * 101)
+    steps = np.cumsum(steps.reshape(n_logs, 101), axis=1)[:, :100]
+
+    # A rotation of zero clicks only counts if the dial rests on a multiple of 100
+    resting = np.bincount(log_ids[~moving] * 100 + at_zero[~moving], minlength=n_logs * 100).reshape(n_logs, 100)
+    part_two = constant[:, None] + steps + resting
+
+    return part_one, part_two
+
+
+def count_dial_zeros_batched(starting_values, logs: list) -> tuple:
+    """Count the zeros (part 1 and part 2) of each log of rotations for each of the starting values."""
+    part_one, part_two = tabulate_dial_zeros(logs)
+    residues = np.asarray(starting_values, dtype=np.int64) % 100
+    return part_one[:, residues], part_two[:, residues]
+
+
+def hash_log_sample(file, offset: int) -> str:
+    """Hash the start and the end of the first OFFSET bytes of a log, to detect a rewritten log."""
+    file.seek(0)
+    head = file.read(min(offset, CHECKPOINT_SAMPLE_BYTES))
+    file.seek(max(offset - CHECKPOINT_SAMPLE_BYTES, 0))
+    tail = file.read(offset - file.tell())
+    return hashlib.blake2b(head + b"|" + tail, digest_size=16).hexdigest()
+
+
+def load_checkpoint(checkpoint_path: str, file, starting_value: int) -> dict:
+    """Load the checkpoint of a log, or the initial state if there is none or the log was truncated or rewritten."""
+    initial = {
+        "starting_value": starting_value,
+        "offset": 0,
+        "value": starting_value % 100,
+        "part_one": int(starting_value % 100 == 0),
+        "part_two": 0,
+    }
+    try:
+        with open(checkpoint_path, "r") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+    except (OSError, ValueError):
+        return initial
+
+    if (
+        checkpoint.get("starting_value") != starting_value
+        or checkpoint["offset"] > os.fstat(file.fileno()).st_size
+        or checkpoint["sample_hash"] != hash_log_sample(file, checkpoint["offset"])
+    ):
+        logging.info("Log does not match the checkpoint, replaying it from the start.")
+        return initial
+    return checkpoint
+
+
+def apply_rotations(state: dict, data: bytes) -> dict:
+    """Apply the rotations in a piece of a log to the dial value and counts of a checkpoint."""
+    rotations = convert_input_to_rotations(data.decode().split())
+    part_one, part_two = count_dial_zeros(state["value"], rotations)
+
+    # The dial value of the checkpoint was already counted for part 1
+    return {
+        **state,
+        "value": (state["value"] + sum(rotations)) % 100,
+        "part_one": state["part_one"] + part_one - int(state["value"] == 0),
+        "part_two": state["part_two"] + part_two,
+    }
+
+
+def solve_day_one_incremental(file_path: str = None, checkpoint_path: str = None, starting_value: int = 50) -> tuple:
+    """Solve both parts of day 1 on a growing log, only applying the rotations appended since the last run.
+
+    The dial value and the counts are saved to a checkpoint after every run, by default next to
+    the log. The counts only depend on the dial value modulo 100, so that is all that is saved.
+    A last line without newline only counts if it is a complete rotation. It cannot be told
+    apart from a rotation of which more digits are still being written.
+    """
+    file_path = resolve_input_path(1, file_path)
+    if file_path == "-":
+        raise ValueError("Incremental solving needs a log file, not stdin.")
+    checkpoint_path = checkpoint_path or file_path + ".checkpoint.json"
+
+    with open(file_path, "rb") as file:
+        state = load_checkpoint(checkpoint_path, file, starting_value)
+        file.seek(state["offset"])
+        appended = file.read()
+
+        # Only complete lines are checkpointed, the last line may still be being written
+        complete = appended.rfind(b"\n") + 1
+        state = apply_rotations(state, appended[:complete])
+        state["offset"] += complete
+        state["sample_hash"] = hash_log_sample(file, state["offset"])
+
+    # Replace the checkpoint in one go, so an interrupted run cannot leave half a checkpoint
+    with open(checkpoint_path + ".tmp", "w") as checkpoint_file:
+        json.dump(state, checkpoint_file)
+    os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+    # The last line does count for the answers of this run, unless it is only partly written
+    if ROTATION.fullmatch(appended[complete:]):
+        state = apply_rotations(state, appended[complete:])
+    return state["part_one"], state["part_two"]
+
+
+def main(argv: list = None):
     """Entry point of code."""
+    parser = argparse.ArgumentParser(description="Solve Advent of Code 2025: Day 1.")
+    parser.add_argument("--incremental", action="store_true", help="only apply the rotations appended since the previous run")
+    parser.add_argument("--checkpoint", help="checkpoint file of the incremental mode (default: next to the puzzle input)")
+    args = parser.parse_args(argv)
+
     setup_logging()
     logging.info("Start of script.")
 
-    input = read_puzzle_input()
-    logging.info("Read puzzle input.")
-
-    rotations = convert_input_to_rotations(input)
-    logging.info("Converted puzzle input to list of rotations.")
-
     starting_value = 50
-    logging.info("Initialised the dial to starting position.")
+    if args.incremental:
+        # Only the rotations appended since the previous run are read and applied
+        solution_part_one, solution_part_two = solve_day_one_incremental(None, args.checkpoint, starting_value)
+    else:
+        input = read_puzzle_input()
+        logging.info("Read puzzle input.")
 
-    solution_part_one = solve_day_one_part_one(starting_value, rotations)
+        rotations = convert_input_to_rotations(input)
+        logging.info("Converted puzzle input to list of rotations.")
+
+        solution_part_one, solution_part_two = count_dial_zeros(starting_value, rotations)
     logging.info(f"Solved part 1! The password to open the door is: {solution_part_one}.")
-    
-    solution_part_two = solve_day_one_part_two(starting_value, rotations)
+
     logging.info(f"Solved part 2! The password to open the door is: {solution_part_two}.")
 
     logging.info("End of script.")
@@ -5,18 +5,14 @@ import os
 
 from math import floor
 
+from loader import load_puzzle_text
 from log import setup_logging
 
 
-def read_puzzle_input() -> list:
+def read_puzzle_input(file_path: str = None) -> list:
     """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day2.txt"
-
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.replace("\n","").split(",")]
+    input_raw = load_puzzle_text(2, file_path)
+    return input_raw.replace("\n","").split(",")
 
 
 def is_strictly_repetitive(n: int) -> bool:
@@ -92,6 +88,230 @@ def solve_day_two_part_two(input: list) -> int:
     return sum(repetitive_numbers)
 
 
+def get_product_range(product_range: str) -> tuple:
+    """Split a product range of the form <lower>-<upper> into its bounds."""
+    product_ids = product_range.split("-")
+    return int(product_ids[0]), int(product_ids[1])
+
+
+def get_prime_factors(n: int) -> list:
+    """Find the distinct prime factors of N."""
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors += [p]
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors += [n]
+    return factors
+
+
+def sum_periodic_numbers(lower: int, upper: int, n_digits: int, period: int) -> int:
+    """Sum all numbers in [LOWER, UPPER] with N_DIGITS digits made of a repeated block of PERIOD digits."""
+    # Each such number equals its first block times a multiplier of the form 1001001,
+    # so the numbers form an arithmetic series over the allowed values of the first block
+    multiplier = (10**n_digits - 1) // (10**period - 1)
+    block_lower = max(10**(period - 1), -(-lower // multiplier))
+    block_upper = min(10**period - 1, upper // multiplier)
+
+    if block_lower > block_upper:
+        return 0
+    return multiplier * (block_lower + block_upper) * (block_upper - block_lower + 1) // 2
+
+
+def sum_strictly_repetitive(lower: int, upper: int) -> int:
+    """Sum all strictly repetitive numbers in [LOWER, UPPER] in closed form."""
+    # Only numbers with an even number of digits can be split into two identical halves
+    result = 0
+    for n_digits in range(len(str(lower)), len(str(upper)) + 1):
+        if n_digits % 2 == 0:
+            result += sum_periodic_numbers(lower, upper, n_digits, n_digits // 2)
+    return result
+
+
+def sum_approximately_repetitive(lower: int, upper: int) -> int:
+    """Sum all approximately repetitive numbers in [LOWER, UPPER] in closed form."""
+    result = 0
+    for n_digits in range(len(str(lower)), len(str(upper)) + 1):
+        # Every repetitive number repeats a block of N_DIGITS / q digits for some prime q.
+        # A number repeating blocks for several primes (like 111111) repeats a block whose length
+        # is the greatest common divisor, so use inclusion-exclusion over the sets of primes.
+        primes = get_prime_factors(n_digits)
+        for subset in range(1, 2**len(primes)):
+            divisor = 1
+            sign = -1
+            for i, q in enumerate(primes):
+                if subset & (1 << i):
+                    divisor *= q
+                    sign = -sign
+            result += sign * sum_periodic_numbers(lower, upper, n_digits, n_digits // divisor)
+    return result
+
+
+def solve_day_two_part_one_closed_form(input: list) -> int:
+    """Solve day 2 part 1 with a closed-form sum per product range."""
+    return sum(sum_strictly_repetitive(*get_product_range(x)) for x in input)
+
+
+def solve_day_two_part_two_closed_form(input: list) -> int:
+    """Solve day 2 part 2 with a closed-form sum per product range."""
+    return sum(sum_approximately_repetitive(*get_product_range(x)) for x in input)
+
+
+def sum_repetitive_block(descriptor: tuple, start: int, stop: int, approximate: bool) -> int:
+    """Parse and sum the repetitive numbers of a block of comma-separated product ranges in shared memory."""
+    from parallel import attach_array
+
+    sum_repetitive = sum_approximately_repetitive if approximate else sum_strictly_repetitive
+    with attach_array(descriptor) as raw:
+        product_ranges = str(raw[start:stop].tobytes(), "utf-8").split(",")
+    return sum(sum_repetitive(*get_product_range(x)) for x in product_ranges)
+
+
+def solve_day_two_parallel(input: list, approximate: bool, max_workers: int = None, min_items_per_chunk: int = 50000) -> int:
+    """Solve day 2 by sharding the product ranges over processes.
+
+    Blocks of fewer than MIN_ITEMS_PER_CHUNK product ranges are not worth starting a worker for.
+    """
+    # NumPy is only needed when sharding, keep it out of the import of this module
+    from parallel import choose_chunks
+
+    # Only shard if there are enough product ranges to outweigh starting the workers
+    sum_repetitive = sum_approximately_repetitive if approximate else sum_strictly_repetitive
+    chunks = choose_chunks(len(input), min_items_per_chunk, max_workers)
+    if len(chunks) == 1:
+        return sum(sum_repetitive(*get_product_range(x)) for x in input)
+
+    import numpy as np
+    from parallel import map_chunks
+
+    # Share the raw product ranges, so the workers parse and sum their own blocks and any
+    # product ID fits. Here only the commas are found, to cut the blocks at whole product ranges.
+    raw = np.frombuffer(",".join(input).encode(), dtype=np.uint8)
+    bounds = np.concatenate([[-1], np.flatnonzero(raw == ord(",")), [raw.size]]).tolist()
+    chunks = [(bounds[start] + 1, bounds[stop]) for start, stop in chunks]
+    return sum(map_chunks(sum_repetitive_block, raw, chunks, approximate, max_workers=max_workers))
+
+
+def solve_day_two_part_one_parallel(input: list, max_workers: int = None) -> int:
+    """Solve day 2 part 1, sharding the product ranges over processes if there are many."""
+    return solve_day_two_parallel(input, False, max_workers)
+
+
+def solve_day_two_part_two_parallel(input: list, max_workers: int = None) -> int:
+    """Solve day 2 part 2, sharding the product ranges over processes if there are many."""
+    return solve_day_two_parallel(input, True, max_workers)
+
+
+class RepetitiveIdTable:
+    """Sorted repetitive product IDs up to a number of digits, with prefix sums to sum any range."""
+
+    def __init__(self, ids, sums, max_digits: int, approximate: bool):
+        """Create a table from the sorted strictly or approximately repetitive IDs with at most MAX_DIGITS digits.
+
+        SUMS holds the prefix sums of the IDs, starting with 0.
+        """
+        self.ids = ids
+        self.sums = sums
+        self.limit = 10**max_digits - 1
+        self.approximate = approximate
+
+    @classmethod
+    def build(cls, max_digits: int, approximate: bool) -> "RepetitiveIdTable":
+        """Generate all strictly or approximately repetitive IDs with at most MAX_DIGITS digits."""
+        import numpy as np
+
+        # All prefix sums have to fit in 64 bits, the largest is the sum of all IDs
+        sum_repetitive = sum_approximately_repetitive if approximate else sum_strictly_repetitive
+        if sum_repetitive(1, 10**max_digits - 1) >= 2**63:
+            raise ValueError(f"The sum of all repetitive IDs up to {max_digits} digits does not fit in 64 bits.")
+
+        # Every repetitive ID is its first block of digits times a multiplier of the form 1001001.
+        # IDs that repeat blocks of several lengths (like 111111) are only kept once.
+        ids = [np.zeros(0, dtype=np.int64)]
+        for n_digits in range(2, max_digits + 1):
+            if approximate:
+                periods = [p for p in range(1, n_digits) if n_digits % p == 0]
+            else:
+                periods = [n_digits // 2] if n_digits % 2 == 0 else []
+
+            blocks = [np.arange(10**(p - 1), 10**p, dtype=np.int64) * ((10**n_digits - 1) // (10**p - 1)) for p in periods]
+            ids.append(np.unique(np.concatenate(blocks + [ids[0]])))
+
+        ids = np.concatenate(ids)
+        sums = np.concatenate([[0], np.cumsum(ids)])
+        return cls(ids, sums, max_digits, approximate)
+
+    @classmethod
+    def load(cls, max_digits: int, approximate: bool, directory: str = None) -> "RepetitiveIdTable":
+        """Memory-map a table saved in the cache directory, building and saving it first if needed."""
+        import numpy as np
+        from cache import get_cache_dir
+
+        directory = directory or get_cache_dir()
+        name = f"day2_{'approximately' if approximate else 'strictly'}_repetitive_{max_digits}"
+        file_paths = {x: os.path.join(directory, f"{name}_{x}.npy") for x in ["ids", "sums"]}
+        if all(os.path.exists(x) for x in file_paths.values()):
+            ids, sums = (np.load(file_paths[x], mmap_mode="r") for x in ["ids", "sums"])
+            return cls(ids, sums, max_digits, approximate)
+
+        # Save to temporary files first, so other processes never load half a table
+        table = cls.build(max_digits, approximate)
+        os.makedirs(directory, exist_ok=True)
+        for x, file_path in file_paths.items():
+            with open(file_path + ".tmp", "wb") as file:
+                np.save(file, getattr(table, x))
+            os.replace(file_path + ".tmp", file_path)
+        return table
+
+    def sum_ranges(self, lower, upper):
+        """Sum the repetitive IDs in each range [LOWER, UPPER] within the table with two binary searches."""
+        import numpy as np
+
+        i = np.searchsorted(self.ids, np.asarray(lower, dtype=np.int64), side="left")
+        j = np.searchsorted(self.ids, np.asarray(upper, dtype=np.int64), side="right")
+        return self.sums[j] - self.sums[i]
+
+
+def solve_day_two_with_table(input: list, table: RepetitiveIdTable) -> int:
+    """Solve day 2 for all product ranges at once with a table of repetitive IDs."""
+    import numpy as np
+
+    # Parse all bounds at once, unless some of them do not fit in 64 bits
+    sum_repetitive = sum_approximately_repetitive if table.approximate else sum_strictly_repetitive
+    try:
+        bounds = np.array(",".join(input).replace("-", ",").split(","), dtype=np.int64).reshape(-1, 2)
+    except OverflowError:
+        bounds = None
+    if bounds is None:
+        return sum(sum_repetitive(*get_product_range(x)) for x in input)
+
+    # The parts of the product ranges above the limit of the table are summed in closed form
+    lower, upper = bounds[:, 0], bounds[:, 1]
+    result = sum(
+        sum_repetitive(max(a, table.limit + 1), b)
+        for a, b in bounds[upper > table.limit].tolist()
+    )
+
+    # The sums of many ranges can exceed 64 bits, so add them up as Python integers
+    within = lower <= table.limit
+    sums = table.sum_ranges(lower[within], np.minimum(upper[within], table.limit))
+    return result + sum(sums.tolist())
+
+
+def solve_day_two_part_one_table(input: list, max_digits: int = 12) -> int:
+    """Solve day 2 part 1 with a saved table of strictly repetitive IDs."""
+    return solve_day_two_with_table(input, RepetitiveIdTable.load(max_digits, False))
+
+
+def solve_day_two_part_two_table(input: list, max_digits: int = 12) -> int:
+    """Solve day 2 part 2 with a saved table of approximately repetitive IDs."""
+    return solve_day_two_with_table(input, RepetitiveIdTable.load(max_digits, True))
+
+
 def main():
     """Entry point of code."""
     setup_logging()
@@ -100,10 +320,10 @@ def main():
     input = read_puzzle_input()
     logging.info("Read puzzle input.")
 
-    solution_part_one = solve_day_two_part_one(input)
+    solution_part_one = solve_day_two_part_one_closed_form(input)
     logging.info(f"Solved part 1! The total sum of all valid IDs is: {solution_part_one}.")
 
-    solution_part_two = solve_day_two_part_two(input)
+    solution_part_two = solve_day_two_part_two_closed_form(input)
     logging.info(f"Solved part 2! The total sum of all valid IDs is: {solution_part_two}.")
 
     logging.info("End of script.")
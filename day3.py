@@ -1,20 +1,17 @@
 """Module for Advent of Code 2025: Day 3."""
 
 import logging
-import os
 
+import numpy as np
+
+from loader import iter_lines, load_puzzle_input, view_as_rows
 from log import setup_logging
+from parallel import attach_array, choose_chunks, map_chunks
 
 
-def read_puzzle_input() -> list:
+def read_puzzle_input(file_path: str = None) -> memoryview:
     """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day3.txt"
-
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.split("\n")]
+    return load_puzzle_input(3, file_path)
 
 
 def find_maximum_joltage_full_search(battery_bank: str) -> int:
@@ -84,6 +81,157 @@ def solve_day_three_part_two(input: list) -> int:
     return sum(joltages)
 
 
+def check_n_choose(n_choose: int, n_batteries: int):
+    """Check that N_CHOOSE batteries can be selected from a bank of N_BATTERIES batteries."""
+    if not 0 < n_choose <= n_batteries:
+        raise ValueError(f"Cannot choose {n_choose} batteries from a bank of {n_batteries} batteries.")
+
+
+def find_maximum_joltage(battery_bank: str, n_choose: int) -> int:
+    """Find maximum joltage of battery bank by selecting N_CHOOSE batteries with a monotonic stack."""
+    check_n_choose(n_choose, len(battery_bank))
+
+    # Keep a stack of selected batteries that is non-increasing from bottom to top. A battery
+    # replaces smaller batteries before it, as long as enough batteries remain to fill the stack.
+    n_drop = len(battery_bank) - n_choose
+    stack = []
+    for battery in battery_bank:
+        while n_drop > 0 and stack and stack[-1] < battery:
+            stack.pop()
+            n_drop -= 1
+        stack.append(battery)
+    return int("".join(stack[:n_choose]))
+
+
+def transform_input_into_banks(input: memoryview):
+    """Transform raw puzzle input into a 2-D array of digits, or a list of banks if their lengths differ."""
+    try:
+        rows = view_as_rows(input)
+    except ValueError:
+        return [str(x, "utf-8") for x in iter_lines(input) if len(x) > 0]
+
+    # Subtracting "0" would wrap any other character around to a large digit
+    if ((rows < ord("0")) | (rows > ord("9"))).any():
+        raise ValueError("Battery banks must only contain digits.")
+    return rows - ord("0")
+
+
+def find_maximum_joltage_batched(banks: np.ndarray, n_choose: int) -> np.ndarray:
+    """Find maximum joltage of each battery bank (row) of a 2-D digit array."""
+    n_banks, n = banks.shape
+    check_n_choose(n_choose, n)
+
+    # Joltages of more than 18 digits no longer fit in 64-bit integers
+    dtype = np.int64 if n_choose <= 18 else object
+    result = np.zeros(n_banks, dtype=dtype)
+
+    # Process the banks in blocks of rows to bound the size of the temporary arrays
+    rows_per_block = max(1, 2**24 // max(n, 1))
+    for first in range(0, n_banks, rows_per_block):
+        block = banks[first:first + rows_per_block]
+        rows = np.arange(block.shape[0])
+        joltage = np.zeros(block.shape[0], dtype=dtype)
+        start = np.zeros(block.shape[0], dtype=np.intp)
+
+        # Select each time the first largest digit in the dynamic interval of every bank, keeping in
+        # mind the number of batteries we still have to pick. Digits before the start are masked.
+        for j in range(n_choose):
+            lowest = start.min()
+            end = n - n_choose + j + 1
+            columns = np.arange(lowest, end)
+            window = np.where(columns >= start[:, None], block[:, lowest:end], np.int16(-1))
+            picked = window.argmax(axis=1) + lowest
+
+            joltage = joltage * 10 + block[rows, picked].astype(dtype)
+            start = picked + 1
+
+        result[first:first + rows_per_block] = joltage
+    return result
+
+
+def solve_day_three(banks, n_choose: int) -> int:
+    """Solve day 3 for an arbitrary number of batteries to choose per bank."""
+    if isinstance(banks, list):
+        # Banks of different lengths cannot be stacked into an array
+        return sum(find_maximum_joltage(x, n_choose) for x in banks)
+    return sum(find_maximum_joltage_batched(banks, n_choose).tolist())
+
+
+class JoltageIndex:
+    """Sparse table of a battery bank to find the maximum joltage for any number of batteries to choose."""
+
+    def __init__(self, battery_bank):
+        """Build the index of a battery bank given as a string or a sequence of digits."""
+        self.digits = [int(x) for x in battery_bank]
+
+        # Level L holds for every position the index of the first largest battery in the interval
+        # of 2^L batteries starting at that position. Every level is built from the previous one.
+        self.levels = [list(range(len(self.digits)))]
+        width = 1
+        while 2 * width <= len(self.digits):
+            previous = self.levels[-1]
+            self.levels.append([a if self.digits[a] >= self.digits[b] else b for a, b in zip(previous, previous[width:])])
+            width *= 2
+
+    def __len__(self) -> int:
+        """Number of batteries in the bank."""
+        return len(self.digits)
+
+    def argmax(self, lower: int, upper: int) -> int:
+        """Find the index of the first largest battery in [LOWER, UPPER] with two overlapping intervals."""
+        level = (upper - lower + 1).bit_length() - 1
+        a = self.levels[level][lower]
+        b = self.levels[level][upper - (1 << level) + 1]
+        return a if self.digits[a] >= self.digits[b] else b
+
+    def maximum_joltage(self, n_choose: int) -> int:
+        """Find the maximum joltage of selecting N_CHOOSE batteries, with one interval query per battery."""
+        check_n_choose(n_choose, len(self.digits))
+
+        # Select each time the first largest battery in the dynamic interval, keeping in mind
+        # the number of batteries we still have to pick
+        joltage = 0
+        start = 0
+        for j in range(n_choose):
+            picked = self.argmax(start, len(self.digits) - n_choose + j)
+            joltage = joltage * 10 + self.digits[picked]
+            start = picked + 1
+        return joltage
+
+    def joltage_table(self) -> list:
+        """Find the maximum joltage for every number of batteries, from 0 up to the length of the bank."""
+        # Choosing no batteries gives no joltage
+        return [0] + [self.maximum_joltage(k) for k in range(1, len(self.digits) + 1)]
+
+
+def tabulate_maximum_joltage(banks) -> list:
+    """Find the maximum joltage of each battery bank for every number of batteries to choose."""
+    return [JoltageIndex(x).joltage_table() for x in banks]
+
+
+def sum_maximum_joltage_block(descriptor: tuple, start: int, stop: int, n_choose: int) -> int:
+    """Sum the maximum joltage of a block of battery banks in shared memory."""
+    with attach_array(descriptor) as banks:
+        return sum(find_maximum_joltage_batched(banks[start:stop], n_choose).tolist())
+
+
+def solve_day_three_parallel(banks, n_choose: int, max_workers: int = None, min_items_per_chunk: int = None) -> int:
+    """Solve day 3 by sharding contiguous blocks of battery banks over processes.
+
+    Blocks of fewer than MIN_ITEMS_PER_CHUNK banks are not worth starting a worker for. By default,
+    every block holds enough digits to outweigh starting the workers.
+    """
+    if isinstance(banks, list):
+        return solve_day_three(banks, n_choose)
+
+    if min_items_per_chunk is None:
+        min_items_per_chunk = 2**24 // max(n_choose * banks.shape[1], 1)
+    chunks = choose_chunks(banks.shape[0], min_items_per_chunk, max_workers)
+    if len(chunks) == 1:
+        return solve_day_three(banks, n_choose)
+    return sum(map_chunks(sum_maximum_joltage_block, banks, chunks, n_choose, max_workers=max_workers))
+
+
 def main():
     """Entry point of code."""
     setup_logging()
@@ -92,10 +240,13 @@ def main():
     input = read_puzzle_input()
     logging.info("Read puzzle input.")
 
-    solution_part_one = solve_day_three_part_one(input)
+    banks = transform_input_into_banks(input)
+    logging.info("Transformed puzzle input into battery banks.")
+
+    solution_part_one = solve_day_three(banks, 2)
     logging.info(f"Solved part 1! The total joltage output is: {solution_part_one}.")
 
-    solution_part_two = solve_day_three_part_two(input)
+    solution_part_two = solve_day_three(banks, 12)
     logging.info(f"Solved part 2! The total joltage output is: {solution_part_two}.")
 
     logging.info("End of script.")
@@ -1,75 +1,213 @@
 """Module for Advent of Code 2025: Day 4."""
 
 import logging
-import os
 
-import pandas as pd
-from warnings import simplefilter
+import numpy as np
 
+from loader import load_puzzle_input, view_as_rows
 from log import setup_logging
 
 
-def read_puzzle_input() -> list:
+def read_puzzle_input(file_path: str = None) -> memoryview:
     """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day4.txt"
+    return load_puzzle_input(4, file_path)
 
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.replace(".","0").replace("@","1").split("\n")]
 
+def transform_input_into_grid(input: memoryview) -> np.ndarray:
+    """Transform raw puzzle input into a grid with one byte per position."""
+    return (view_as_rows(input) == ord("@")).view(np.uint8)
 
-def transform_input_into_grid(input: list) -> pd.DataFrame:
-    """Transform list of input strings into grid."""
-    result = []
-    for i in range(0, len(input)):
-        result.append([int(c) for c in input[i]])
-    return pd.DataFrame(result)
 
-
-def identify_number_of_neighbouring_rolls(df: pd.DataFrame) -> pd.DataFrame:
+def identify_number_of_neighbouring_rolls(grid: np.ndarray) -> np.ndarray:
     """Identify the number of neighbouring rolls for each position."""
-    # Shift the original dataframe both along the horizontal and vertical axis 
-    # simultaneously and take the summation over all dataframes. Start with the
-    # original dataframe multiplied by -1 to ignore the current position.
-    result = -df
+    # Pad the grid with an empty border and add the eight shifted views of the padded grid.
+    # The additions are done in place, so no temporary array is created for each offset.
+    n_rows, n_columns = grid.shape
+    padded = np.pad(grid, 1)
+    result = np.zeros(grid.shape, dtype=np.uint8)
     for h in [-1,0,1]: # horizontal offset
         for v in [-1,0,1]: # vertical offset
-            result += df.shift(periods=v, axis=0).shift(periods=h, axis=1).fillna(0)
+            if h == 0 and v == 0:
+                continue
+            np.add(result, padded[1+v:1+v+n_rows, 1+h:1+h+n_columns], out=result)
     return result
 
 
-def solve_day_four_part_one(grid: pd.DataFrame) -> int:
+class RollGrid:
+    """Paper rolls with the number of neighbouring rolls of each roll, updated incrementally.
+
+    Adding or removing rolls only updates the 3x3 areas around them, and the accessible rolls
+    (with fewer than 4 neighbours) are kept up to date, so both take time in the order of the
+    size of the change instead of the size of the grid. The accessible rolls are kept as a mask
+    and their number, and also as a set of indices once they are first listed, so a grid that
+    is only counted never holds a Python object per roll.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        """Count the neighbouring rolls of every position of a grid with ones at the rolls."""
+        self.shape = grid.shape
+
+        # Work on the flattened padded grid, so the neighbours of any position are found by
+        # adding a fixed set of offsets. The border is never occupied.
+        self.width = self.shape[1] + 2
+        self.offsets = np.array([v * self.width + h for v in [-1,0,1] for h in [-1,0,1] if (v, h) != (0, 0)])
+        self.present = np.pad(grid, 1).astype(bool).ravel()
+        self.counts = np.pad(identify_number_of_neighbouring_rolls(grid), 1).ravel()
+        self.accessible = self.present & (self.counts < 4)
+        self.n_accessible = int(np.count_nonzero(self.accessible))
+        self.accessible_indices = None
+
+    def __len__(self) -> int:
+        """Number of rolls."""
+        return int(np.count_nonzero(self.present))
+
+    def copy(self) -> "RollGrid":
+        """Copy the grid, e.g. to peel it without changing this grid."""
+        other = RollGrid.__new__(RollGrid)
+        other.shape = self.shape
+        other.width = self.width
+        other.offsets = self.offsets
+        other.present = self.present.copy()
+        other.counts = self.counts.copy()
+        other.accessible = self.accessible.copy()
+        other.n_accessible = self.n_accessible
+        other.accessible_indices = None if self.accessible_indices is None else set(self.accessible_indices)
+        return other
+
+    def to_flat(self, positions) -> np.ndarray:
+        """Convert (row, column) positions into indices of the flattened padded grid."""
+        positions = np.asarray(positions, dtype=np.intp).reshape(-1, 2)
+        rows, columns = positions[:, 0], positions[:, 1]
+        if ((rows < 0) | (rows >= self.shape[0]) | (columns < 0) | (columns >= self.shape[1])).any():
+            raise ValueError("Positions must be within the grid.")
+        return (rows + 1) * self.width + columns + 1
+
+    def to_positions(self, flat: np.ndarray) -> np.ndarray:
+        """Convert indices of the flattened padded grid into (row, column) positions."""
+        rows, columns = np.divmod(flat, self.width)
+        return np.stack([rows - 1, columns - 1], axis=1)
+
+    def count_accessible(self) -> int:
+        """Count the rolls that can be removed, i.e. that have fewer than 4 neighbouring rolls."""
+        return self.n_accessible
+
+    def accessible_rolls(self) -> np.ndarray:
+        """Find the (row, column) positions of the rolls that can be removed, in no specific order."""
+        # Only the first call looks at the whole grid, after that the set is kept up to date
+        if self.accessible_indices is None:
+            self.accessible_indices = set(np.flatnonzero(self.accessible).tolist())
+        indices = np.fromiter(self.accessible_indices, dtype=np.intp, count=len(self.accessible_indices))
+        return self.to_positions(indices)
+
+    def add_rolls(self, positions):
+        """Add rolls at (row, column) positions, ignoring positions that already have a roll."""
+        flat = np.unique(self.to_flat(positions))
+        self._update(flat[~self.present[flat]], True)
+
+    def remove_rolls(self, positions):
+        """Remove rolls at (row, column) positions, ignoring positions that do not have a roll."""
+        flat = np.unique(self.to_flat(positions))
+        self._update(flat[self.present[flat]], False)
+
+    def _update(self, flat: np.ndarray, present: bool):
+        """Add or remove rolls at distinct indices of the flattened padded grid."""
+        # The neighbour counts are only kept up to date at the rolls. Update the counts of the
+        # other rolls around the changed positions, a roll can neighbour several of them.
+        if not present:
+            self.present[flat] = False
+        neighbours = (flat[:, None] + self.offsets).ravel()
+        neighbours, changes = np.unique(neighbours[self.present[neighbours]], return_counts=True)
+        if present:
+            self.counts[neighbours] += changes.astype(np.uint8)
+        else:
+            self.counts[neighbours] -= changes.astype(np.uint8)
+
+        # Added rolls count their neighbours from scratch, including the other added rolls
+        if present:
+            self.present[flat] = True
+            self.counts[flat] = np.count_nonzero(self.present[flat[:, None] + self.offsets], axis=1)
+
+        # Only the changed positions and their neighbours can change whether they are accessible.
+        # Both are distinct, as the neighbours only include rolls that were not changed.
+        changed = np.concatenate([flat, neighbours])
+        accessible = self.present[changed] & (self.counts[changed] < 4)
+        self.n_accessible += int(np.count_nonzero(accessible)) - int(np.count_nonzero(self.accessible[changed]))
+        self.accessible[changed] = accessible
+        if self.accessible_indices is not None:
+            self.accessible_indices.difference_update(changed[~accessible].tolist())
+            self.accessible_indices.update(changed[accessible].tolist())
+
+    def peel(self, return_rounds: bool = False):
+        """Remove the accessible rolls round by round until none are left, and count the removed rolls.
+
+        If RETURN_ROUNDS is set, also return a grid with the round in which each roll was removed.
+        """
+        rounds = np.zeros(self.present.size, dtype=np.int32) if return_rounds else None
+        queue = np.flatnonzero(self.accessible)
+        n_removed = 0
+        round_number = 0
+
+        while queue.size > 0:
+            round_number += 1
+            self.present[queue] = False
+            n_removed += queue.size
+            if rounds is not None:
+                rounds[queue] = round_number
+
+            # Decrement the neighbour count of the remaining neighbours of the removed rolls
+            neighbours = (queue[:, None] + self.offsets).ravel()
+            neighbours = neighbours[self.present[neighbours]]
+            neighbours, decrements = np.unique(neighbours, return_counts=True)
+            self.counts[neighbours] -= decrements.astype(np.uint8)
+
+            # Only neighbours that dropped below 4 can be removed in the next round
+            queue = neighbours[self.counts[neighbours] < 4]
+
+        # Peeling only stops once no rolls are accessible
+        self.accessible[:] = False
+        self.n_accessible = 0
+        if self.accessible_indices is not None:
+            self.accessible_indices.clear()
+
+        if rounds is None:
+            return n_removed
+        return n_removed, rounds.reshape(self.shape[0] + 2, self.width)[1:-1, 1:-1]
+
+
+def solve_day_four_part_one(grid: np.ndarray) -> int:
     """Solve day 4 part 1."""
     # Rolls of paper can be removed if number of neighbours is smaller than 4
-    neighbours = identify_number_of_neighbouring_rolls(grid)
-    return ((neighbours < 4) & (grid == 1)).sum(axis=1).sum(axis=0)
+    return RollGrid(grid).count_accessible()
 
 
-def solve_day_four_part_two(grid: list) -> int:
+def solve_day_four_part_two(grid: np.ndarray) -> int:
     """Solve day 4 part 2."""
-    n_rolls = grid.sum(axis=1).sum(axis=0)
+    grid = grid.copy()
+    n_rolls = int(np.count_nonzero(grid))
 
     # Iteratively remove paper rolls and update the grid afterwards
     while True:
         neighbours = identify_number_of_neighbouring_rolls(grid)
-        rolls_to_remove = ((neighbours < 4) & grid == 1)
+        rolls_to_remove = (neighbours < 4) & (grid == 1)
 
         # Stop once we can no longer remove any paper rolls
-        if rolls_to_remove.sum(axis=1).sum(axis=0) == 0:
+        if not rolls_to_remove.any():
             break
 
-        grid -= rolls_to_remove
-    
+        grid[rolls_to_remove] = 0
+
     # Return total number of paper rolls that have been removed
-    return n_rolls - grid.sum(axis=1).sum(axis=0)
+    return n_rolls - int(np.count_nonzero(grid))
+
+
+def peel_rolls(grid: np.ndarray, return_rounds: bool = False):
+    """Remove paper rolls round by round, only revisiting the neighbours of removed rolls."""
+    return RollGrid(grid).peel(return_rounds)
 
 
 def main():
     """Entry point of code."""
     setup_logging()
-    simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
     logging.info("Start of script.")
 
     input = read_puzzle_input()
@@ -81,7 +219,7 @@ def main():
     solution_part_one = solve_day_four_part_one(grid)
     logging.info(f"Solved part 1! The total number of rolls that can be removed is: {solution_part_one}.")
 
-    solution_part_two = solve_day_four_part_two(grid)
+    solution_part_two = peel_rolls(grid)
     logging.info(f"Solved part 2! The total number of rolls that have been removed is: {solution_part_two}.")
 
     logging.info("End of script.")
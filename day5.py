@@ -1,95 +1,172 @@
 """Module for Advent of Code 2025: Day 5."""
 
 import logging
-import os
 
-import pandas as pd
+from bisect import bisect_left, bisect_right
 
+import numpy as np
+
+from loader import load_puzzle_input, split_sections
 from log import setup_logging
 
 
-def read_puzzle_input() -> list:
+def read_puzzle_input(file_path: str = None) -> list:
     """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day5.txt"
-
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.split("\n\n")]
-
-
-def get_fresh_ingredients(input: list) -> pd.DataFrame:
+    # Split the puzzle input into the fresh ingredient ranges and the ingredient list
+    return [str(x, "utf-8") for x in split_sections(load_puzzle_input(5, file_path))]
+
+
+class FreshIngredientIndex:
+    """Sorted and merged fresh ingredient ranges stored as two integer arrays."""
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray):
+        """Sort and merge the (inclusive) ranges given by the LOWER and UPPER bounds."""
+        order = np.argsort(lower, kind="stable")
+        lower = np.asarray(lower, dtype=np.int64)[order]
+        upper = np.asarray(upper, dtype=np.int64)[order]
+
+        # After sorting on the lower bound, a range starts a new merged range if it begins after
+        # the largest upper bound seen so far. Adjacent ranges are merged as well.
+        running_upper = np.maximum.accumulate(upper)
+        new_range = np.ones(lower.size, dtype=bool)
+        new_range[1:] = lower[1:] > running_upper[:-1] + 1
+        starts = np.flatnonzero(new_range)
+        ends = np.append(starts[1:], lower.size)[:starts.size] - 1
+
+        self.lower = lower[starts]
+        self.upper = running_upper[ends]
+
+    def __len__(self) -> int:
+        """Number of merged ranges."""
+        return self.lower.size
+
+    def contains(self, ingredients: np.ndarray) -> np.ndarray:
+        """Check for each ingredient whether it is within any of the fresh ingredient ranges."""
+        ingredients = np.asarray(ingredients, dtype=np.int64)
+        if len(self) == 0:
+            return np.zeros(ingredients.shape, dtype=bool)
+
+        # Find the last range starting at or before each ingredient and check its upper bound
+        i = np.searchsorted(self.lower, ingredients, side="right") - 1
+        return (i >= 0) & (ingredients <= self.upper[np.maximum(i, 0)])
+
+    def size(self) -> int:
+        """Count the number of ingredient IDs covered by the fresh ingredient ranges."""
+        return int((self.upper - self.lower + 1).sum())
+
+    def to_arrays(self) -> dict:
+        """Arrays to store the index in, e.g. to cache it on disk."""
+        return {"lower": self.lower, "upper": self.upper}
+
+    @classmethod
+    def from_arrays(cls, arrays: dict) -> "FreshIngredientIndex":
+        """Restore an index from the arrays given by to_arrays, without sorting and merging again."""
+        index = cls.__new__(cls)
+        index.lower = arrays["lower"]
+        index.upper = arrays["upper"]
+        return index
+
+
+class FreshIngredientSet:
+    """Fresh ingredient ranges that can be inserted and deleted while answering queries.
+
+    The ranges are kept disjoint and merged in two sorted lists of bounds, so an update takes
+    a binary search plus time in the order of the number of ranges it merges or splits. The
+    number of fresh ingredient IDs is kept as a running total.
+    """
+
+    def __init__(self, index: FreshIngredientIndex = None):
+        """Create an empty set, or a set with the ranges of an index."""
+        self.lower = [] if index is None else index.lower.tolist()
+        self.upper = [] if index is None else index.upper.tolist()
+        self.total = 0 if index is None else index.size()
+
+    def __len__(self) -> int:
+        """Number of merged ranges."""
+        return len(self.lower)
+
+    def __contains__(self, ingredient: int) -> bool:
+        """Check whether a single ingredient is within any of the fresh ingredient ranges."""
+        # Find the last range starting at or before the ingredient and check its upper bound
+        i = bisect_right(self.lower, ingredient) - 1
+        return i >= 0 and ingredient <= self.upper[i]
+
+    def insert(self, lower: int, upper: int):
+        """Insert the (inclusive) range from LOWER to UPPER, merging it with the ranges it overlaps or touches."""
+        if lower > upper:
+            raise ValueError(f"Invalid range: {lower}-{upper}.")
+
+        # The ranges from I up to J end at or after LOWER - 1 and start at or before UPPER + 1
+        i = bisect_left(self.upper, lower - 1)
+        j = bisect_right(self.lower, upper + 1)
+        if i < j:
+            lower = min(lower, self.lower[i])
+            upper = max(upper, self.upper[j-1])
+
+        self.total += (upper - lower + 1) - sum(self.upper[k] - self.lower[k] + 1 for k in range(i, j))
+        self.lower[i:j] = [lower]
+        self.upper[i:j] = [upper]
+
+    def delete(self, lower: int, upper: int):
+        """Delete the (inclusive) range from LOWER to UPPER, splitting the ranges it partly overlaps."""
+        if lower > upper:
+            raise ValueError(f"Invalid range: {lower}-{upper}.")
+
+        # The ranges from I up to J end at or after LOWER and start at or before UPPER. Only the
+        # parts of the first and last of these ranges outside of the deleted range are kept.
+        i = bisect_left(self.upper, lower)
+        j = bisect_right(self.lower, upper)
+        if i >= j:
+            return
+
+        kept = []
+        if self.lower[i] < lower:
+            kept.append((self.lower[i], lower - 1))
+        if self.upper[j-1] > upper:
+            kept.append((upper + 1, self.upper[j-1]))
+
+        self.total -= sum(self.upper[k] - self.lower[k] + 1 for k in range(i, j))
+        self.total += sum(b - a + 1 for a, b in kept)
+        self.lower[i:j] = [a for a, _ in kept]
+        self.upper[i:j] = [b for _, b in kept]
+
+    def contains(self, ingredients: np.ndarray) -> np.ndarray:
+        """Check for each ingredient whether it is within any of the fresh ingredient ranges."""
+        return self.to_index().contains(ingredients)
+
+    def size(self) -> int:
+        """Count the number of ingredient IDs covered by the fresh ingredient ranges."""
+        return self.total
+
+    def to_index(self) -> FreshIngredientIndex:
+        """Take a snapshot of the ranges as an index, e.g. to check many ingredients at once."""
+        return FreshIngredientIndex.from_arrays({
+            "lower": np.array(self.lower, dtype=np.int64),
+            "upper": np.array(self.upper, dtype=np.int64),
+        })
+
+
+def get_fresh_ingredients(input: list) -> FreshIngredientIndex:
     """Extract fresh ingredient ranges from puzzle input."""
-    ingredient_ranges = input[0].split("\n")
-    return pd.DataFrame([
-        [int(x.split("-")[0]) for x in ingredient_ranges],
-        [int(x.split("-")[1]) for x in ingredient_ranges],
-    ]).T
+    ingredient_ranges = np.array(input[0].replace("-", "\n").split(), dtype=np.int64).reshape(-1, 2)
+    return FreshIngredientIndex(ingredient_ranges[:, 0], ingredient_ranges[:, 1])
 
 
-def get_ingredient_list(input: list) -> list:
+def get_ingredient_list(input: list) -> np.ndarray:
     """Extract ingredient list from puzzle input."""
-    return [int(x) for x in input[1].split("\n")]
+    return np.array(input[1].split(), dtype=np.int64)
 
 
-def solve_day_five_part_one(ingredients_list: list, fresh_ingredients: pd.DataFrame) -> int:
+def solve_day_five_part_one(ingredients_list: np.ndarray, fresh_ingredients: FreshIngredientIndex) -> int:
     """Solve day 5 part 1."""
     # An ingredient is fresh if it is within the fresh ingredients range
-    # That is, it is larger than the minimum and smaller than the maximum
-    fresh = []
-    for ingredient in ingredients_list:
-        result = any((ingredient >= fresh_ingredients[0]) & (ingredient <= fresh_ingredients[1]))
-        fresh += [result]
-    return sum(fresh)
+    return int(np.count_nonzero(fresh_ingredients.contains(ingredients_list)))
 
 
-def solve_day_five_part_two(fresh_ingredients: pd.DataFrame) -> int:
+def solve_day_five_part_two(fresh_ingredients: FreshIngredientIndex) -> int:
     """Solve day 5 part 2."""
-    # Loop through all fresh ingredients ranges and keep track of the ranges
-    # Identify whether the ranges (partially) overlap and update the ranges accordingly
-    product_ranges = pd.DataFrame(fresh_ingredients.iloc[0]).T
-
-    for i in fresh_ingredients.index[1:]:
-        lower, upper = fresh_ingredients.iloc[i,]
-        
-        # Check whether entire interval is already included in product_ranges
-        if any((lower >= product_ranges[0]) & (upper <= product_ranges[1])) == True:
-            continue
-
-        # Identify whether this range partially or fully overlaps with another interval
-        overlap_indices = (
-            # Partial overlap on the left side
-            product_ranges.index[(lower <= product_ranges[0]) & (upper >= product_ranges[0])].tolist()
-            # Partial overlap on the right side
-            + product_ranges.index[(lower <= product_ranges[1]) & (upper >= product_ranges[1])].tolist()
-            # Complete overlap
-            + product_ranges.index[(lower <= product_ranges[0]) & (upper >= product_ranges[1])].tolist()
-        )
-
-        # Deduplicate the indices
-        overlap_indices = [i for i in set(overlap_indices)]
-
-        if len(overlap_indices) == 0:
-            # Add new interval to product ranges
-            product_ranges = pd.concat([
-                product_ranges,
-                pd.Series([lower, upper]).to_frame().T
-            ], ignore_index=True)
-        else:
-            # Fix overlapping product ranges by setting new lower and upper bound over entire interval
-            overlapping_ranges = product_ranges.iloc[overlap_indices]
-            overlapping_lower = min(overlapping_ranges[0].tolist() + [lower])
-            overlapping_upper = max(overlapping_ranges[1].tolist() + [upper])
-
-            # Remove overlapping indices from product_ranges and re-add new interval
-            product_ranges = product_ranges.drop(overlap_indices)
-            product_ranges = pd.concat([
-                product_ranges,
-                pd.Series([overlapping_lower, overlapping_upper]).to_frame().T
-            ], ignore_index=True)
-
-    return sum((product_ranges[1] - product_ranges[0]) + 1)
+    # The merged ranges no longer overlap, so the sizes of the ranges can simply be added
+    return fresh_ingredients.size()
 
 
 def main():
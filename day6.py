@@ -1,27 +1,25 @@
 """Module for Advent of Code 2025: Day 6."""
 
 import logging
-import os
+
+from math import prod
 
 import numpy as np
-import pandas as pd
 
+from loader import iter_lines, load_puzzle_input
 from log import setup_logging
 
 
-def read_puzzle_input() -> list:
+def read_puzzle_input(file_path: str = None) -> memoryview:
     """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day6.txt"
+    return load_puzzle_input(6, file_path)
 
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.split("\n")]
-    
 
 def solve_day_six_part_one(input: list) -> int:
     """Solve day 6 part 1."""
+    # Only import pandas when this reference solver is used
+    import pandas as pd
+
     # Extract the operations and blocks of numbers from the puzzle input
     operations = [x for x in input[-1].split(" ") if x != ""]
     numbers = pd.DataFrame([list(map(int, line.split())) for line in input[:-1]])
@@ -75,6 +73,158 @@ def solve_day_six_part_two(input: list) -> int:
     return sum(result)
 
 
+def transform_input_into_matrix(input: memoryview) -> np.ndarray:
+    """Transform raw worksheet into a 2-D matrix of characters, padding short lines with spaces."""
+    lines = [x for x in iter_lines(input) if len(x) > 0]
+    width = max(len(x) for x in lines)
+    matrix = np.full((len(lines), width), ord(" "), dtype=np.uint8)
+    for i, line in enumerate(lines):
+        matrix[i, :len(line)] = np.frombuffer(line, dtype=np.uint8)
+    return matrix
+
+
+def find_problem_blocks(matrix: np.ndarray) -> tuple:
+    """Find the first and last column of each problem, which are separated by blank columns."""
+    filled = (matrix != ord(" ")).any(axis=0)
+    previous_filled = np.zeros_like(filled)
+    previous_filled[1:] = filled[:-1]
+    next_filled = np.zeros_like(filled)
+    next_filled[:-1] = filled[1:]
+
+    starts = np.flatnonzero(filled & ~previous_filled)
+    ends = np.flatnonzero(filled & ~next_filled)
+    return starts, ends
+
+
+def read_operators(matrix: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Read the operator of each problem from the last row of the worksheet."""
+    # The operator is the only character in the last row of a block, and spaces
+    # sort before "+" and "*", so the maximum in each block is the operator
+    return np.maximum.reduceat(matrix[-1], starts)
+
+
+def read_numbers_row_wise(matrix: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> tuple:
+    """Read the numbers of each problem left-to-right per row, as a (rows, problems) array.
+
+    Numbers of blocks wider than 18 digits are zero in the array and are returned exactly as
+    Python integers in a dictionary by (row, problem) instead.
+    """
+    numbers = matrix[:-1, starts[0]:]
+    is_digit = (numbers >= ord("0")) & (numbers <= ord("9"))
+
+    # Numbers of more than 18 digits do not fit in 64-bit integers, so read these blocks with
+    # Python integers and leave them out of the vectorised reading
+    wide = {}
+    for problem in np.flatnonzero(ends - starts >= 18).tolist():
+        block = slice(starts[problem] - starts[0], ends[problem] - starts[0] + 1)
+        for row in range(numbers.shape[0]):
+            digits = numbers[row, block][is_digit[row, block]]
+            wide[row, problem] = int(bytes(digits)) if digits.size > 0 else 0
+        is_digit[:, block] = False
+
+    # The place value of a digit depends on the number of digits to its right within its block.
+    # Find these with a cumulative sum over the row, relative to the cumulative sum at the block end.
+    cumulative = np.cumsum(is_digit, axis=1)
+    block_sizes = np.diff(np.append(starts, matrix.shape[1]))
+    cumulative_at_end = np.repeat(cumulative[:, ends - starts[0]], block_sizes, axis=1)
+    place = cumulative_at_end - cumulative
+
+    values = np.where(is_digit, (numbers - ord("0")) * np.power(10, place, dtype=np.int64), 0)
+    return np.add.reduceat(values, starts - starts[0], axis=1), wide
+
+
+def read_numbers_column_wise(matrix: np.ndarray, starts: np.ndarray) -> tuple:
+    """Read the numbers of each problem top-to-bottom per column, with the offset of each problem.
+
+    Numbers of more than 18 digits are zero in the values and are returned exactly as Python
+    integers in a dictionary by their index in the values instead.
+    """
+    numbers = matrix[:-1]
+    is_digit = (numbers >= ord("0")) & (numbers <= ord("9"))
+
+    # Only keep the columns that contain a number and find where each problem starts among them
+    has_digits = is_digit.any(axis=0)
+    offsets = np.concatenate([[0], np.cumsum(has_digits)])[starts]
+
+    # Numbers of more than 18 digits do not fit in 64-bit integers, so read these columns with
+    # Python integers and leave them out of the vectorised reading
+    wide = {}
+    wide_columns = np.flatnonzero(is_digit.sum(axis=0) > 18)
+    for index, column in zip(np.cumsum(has_digits)[wide_columns].tolist(), wide_columns.tolist()):
+        wide[index - 1] = int(bytes(numbers[is_digit[:, column], column]))
+    is_digit[:, wide_columns] = False
+
+    # The place value of a digit depends on the number of digits below it in the same column
+    below = np.cumsum(is_digit[::-1], axis=0)[::-1] - is_digit
+    values = np.where(is_digit, (numbers - ord("0")) * np.power(10, below, dtype=np.int64), 0).sum(axis=0)
+    return values[has_digits], offsets, wide
+
+
+def reduce_problems(values: np.ndarray, offsets: np.ndarray, operators: np.ndarray, wide: dict = None) -> int:
+    """Add up the sum or product of the numbers of each problem exactly, depending on its operator.
+
+    The numbers of each problem are stored back to back in VALUES, starting at the OFFSETS.
+    Numbers that do not fit in 64-bit integers are given exactly by their index in WIDE instead.
+    """
+    counts = np.diff(np.append(offsets, values.size))
+    bits = np.frexp(values.astype(np.float64))[1]
+    result = 0
+
+    # Problems with a wide number are always reduced with Python integers
+    wide = wide or {}
+    if wide:
+        bits[np.fromiter(wide, dtype=np.intp, count=len(wide))] = 64
+
+    # Reduce the problems of each operator at once, after putting their numbers back to back
+    for is_product in [False, True]:
+        selected = (operators == ord("*")) == is_product
+        if not selected.any():
+            continue
+        in_group = np.repeat(selected, counts)
+        group_indices = np.flatnonzero(in_group)
+        group_values, group_bits, group_counts = values[in_group], bits[in_group], counts[selected]
+        group_offsets = np.cumsum(group_counts) - group_counts
+
+        # A product has at most as many bits as its numbers together, and a sum at most the bits
+        # of its largest number plus the bits of the count. Results of more than 63 bits may
+        # overflow, so these problems are reduced with Python integers instead.
+        if is_product:
+            width = np.add.reduceat(group_bits, group_offsets)
+            reduced = np.multiply.reduceat(group_values, group_offsets)
+        else:
+            width = np.maximum.reduceat(group_bits, group_offsets) + np.frexp(group_counts.astype(np.float64))[1]
+            reduced = np.add.reduceat(group_values, group_offsets)
+        safe = width <= 63
+        result += sum(reduced[safe].tolist())
+
+        for start, count in zip(group_offsets[~safe].tolist(), group_counts[~safe].tolist()):
+            indices = group_indices[start:start + count].tolist()
+            numbers = [wide.get(i, x) for i, x in zip(indices, group_values[start:start + count].tolist())]
+            result += prod(numbers) if is_product else sum(numbers)
+
+    return result
+
+
+def solve_day_six_part_one_vectorized(matrix: np.ndarray) -> int:
+    """Solve day 6 part 1 on the character matrix of the worksheet."""
+    starts, ends = find_problem_blocks(matrix)
+    operators = read_operators(matrix, starts)
+    numbers, wide = read_numbers_row_wise(matrix, starts, ends)
+
+    # Put the numbers of each problem (column) back to back
+    n_rows = numbers.shape[0]
+    wide = {problem * n_rows + row: x for (row, problem), x in wide.items()}
+    return reduce_problems(numbers.T.ravel(), np.arange(numbers.shape[1]) * n_rows, operators, wide)
+
+
+def solve_day_six_part_two_vectorized(matrix: np.ndarray) -> int:
+    """Solve day 6 part 2 on the character matrix of the worksheet."""
+    starts, _ = find_problem_blocks(matrix)
+    operators = read_operators(matrix, starts)
+    numbers, offsets, wide = read_numbers_column_wise(matrix, starts)
+    return reduce_problems(numbers, offsets, operators, wide)
+
+
 def main():
     """Entry point of code."""
     setup_logging()
@@ -83,10 +233,13 @@ def main():
     input = read_puzzle_input()
     logging.info("Read puzzle input.")
 
-    solution_part_one = solve_day_six_part_one(input)
+    matrix = transform_input_into_matrix(input)
+    logging.info("Transformed puzzle input into character matrix.")
+
+    solution_part_one = solve_day_six_part_one_vectorized(matrix)
     logging.info(f"Solved part 1! The grand total of all individual problems is: {solution_part_one}.")
 
-    solution_part_two = solve_day_six_part_two(input)
+    solution_part_two = solve_day_six_part_two_vectorized(matrix)
     logging.info(f"Solved part 2! The grand total of all individual problems is: {solution_part_two}.")
 
     logging.info("End of script.")
@@ -1,20 +1,18 @@
 """Module for Advent of Code 2025: Day 7."""
 
 import logging
-import os
+import re
 
+from loader import find_row_layout, iter_lines, load_puzzle_input
 from log import setup_logging
 
 
-def read_puzzle_input() -> list:
-    """Read puzzle input."""
-    file_path = "../inputs"
-    file_name = "day7.txt"
+SPLITTER = re.compile(rb"\^")
+
 
-    file = open(os.path.join(file_path, file_name), "r")
-    input_raw = file.read()
-    file.close()
-    return [x for x in input_raw.split("\n")]
+def read_puzzle_input(file_path: str = None) -> memoryview:
+    """Read puzzle input."""
+    return load_puzzle_input(7, file_path)
 
 
 def solve_day_seven_part_one(input: list) -> int:
@@ -82,6 +80,77 @@ def solve_day_seven_part_two(input: list) -> int:
     return sum(paths)
 
 
+class SplitterIndex:
+    """Sorted splitter columns of each row of the manifold that contains any splitters."""
+
+    def __init__(self, input: memoryview):
+        """Compile the splitter index from the raw puzzle input."""
+        input = memoryview(input)
+        first_line = bytes(next(iter_lines(input), b""))
+        self.width = len(first_line)
+        self.start = [i for (i,x) in enumerate(first_line) if x == ord("S")]
+
+        # Scan the input once for splitters only. If all rows have the same length and line
+        # ending, the row and column follow from the offset. Otherwise scan the input line by line.
+        # Rows without splitters are not stored, they do not change the beams.
+        self.columns = []
+        try:
+            _, _, stride = find_row_layout(input)
+        except ValueError:
+            for line in iter_lines(input):
+                # Beams never leave the width of the first row
+                columns = [match.start() for match in SPLITTER.finditer(line) if match.start() < self.width]
+                if columns:
+                    self.columns.append(columns)
+            return
+
+        previous_row = -1
+        for match in SPLITTER.finditer(input):
+            row, column = divmod(match.start(), stride)
+            if row != previous_row:
+                previous_row = row
+                self.columns.append([])
+            self.columns[-1].append(column)
+
+
+def simulate_beams(index: SplitterIndex) -> tuple:
+    """Count the number of splits (part 1) and the number of paths (part 2) in one pass."""
+    # Keep track of the number of paths that lead to each column, a column has a beam if
+    # this number is positive. Initialise with the starting location(s).
+    paths = [0] * index.width
+    for s in index.start:
+        paths[s] = 1
+    n_splits = 0
+
+    # Only visit the splitters, and only do work where a splitter is hit by a beam
+    for columns in index.columns:
+        hits = [(c, paths[c]) for c in columns if paths[c] > 0]
+        n_splits += len(hits)
+
+        # After a split, move the paths in the splitter column to the left and right columns.
+        # First clear all hit splitter columns so splitters next to each other use the beams
+        # that entered this row.
+        for c, n in hits:
+            paths[c] -= n
+        for c, n in hits:
+            if c > 0:
+                paths[c-1] += n
+            if c < index.width - 1:
+                paths[c+1] += n
+
+    return n_splits, sum(paths)
+
+
+def solve_day_seven_part_one_indexed(index: SplitterIndex) -> int:
+    """Solve day 7 part 1 on the splitter index."""
+    return simulate_beams(index)[0]
+
+
+def solve_day_seven_part_two_indexed(index: SplitterIndex) -> int:
+    """Solve day 7 part 2 on the splitter index."""
+    return simulate_beams(index)[1]
+
+
 def main():
     """Entry point of code."""
     setup_logging()
@@ -90,10 +159,12 @@ def main():
     input = read_puzzle_input()
     logging.info("Read puzzle input.")
 
-    solution_part_one = solve_day_seven_part_one(input)
+    index = SplitterIndex(input)
+    logging.info("Compiled splitter index.")
+
+    solution_part_one, solution_part_two = simulate_beams(index)
     logging.info(f"Solved part 1! The: {solution_part_one}.")
 
-    solution_part_two = solve_day_seven_part_two(input)
     logging.info(f"Solved part 2! The: {solution_part_two}.")
 
     logging.info("End of script.")
@@ -0,0 +1,112 @@
+"""Module for generating synthetic puzzle input of any size."""
+
+import numpy as np
+
+
+def generate_day_one(scale: int, seed: int = 0) -> bytes:
+    """Generate SCALE dial rotations of up to 999 clicks, including rotations of 0 clicks."""
+    rng = np.random.default_rng(seed)
+    directions = rng.choice(["L", "R"], size=scale)
+    clicks = rng.integers(0, 1000, size=scale)
+    return "\n".join(f"{d}{c}" for d, c in zip(directions, clicks.tolist())).encode()
+
+
+def generate_day_two(scale: int, seed: int = 0, max_digits: int = 12, max_width: int = 10**6) -> bytes:
+    """Generate SCALE product ID ranges of up to MAX_WIDTH IDs below 10**MAX_DIGITS."""
+    rng = np.random.default_rng(seed)
+    n_digits = rng.integers(1, max_digits + 1, size=scale)
+    lower = (rng.random(scale) * 10.0**n_digits).astype(np.int64) + 1
+    upper = lower + rng.integers(0, max_width, size=scale)
+    return ",".join(f"{a}-{b}" for a, b in zip(lower.tolist(), upper.tolist())).encode()
+
+
+def generate_day_three(scale: int, seed: int = 0, n_batteries: int = 100) -> bytes:
+    """Generate SCALE battery banks of N_BATTERIES digits from 1 to 9."""
+    rng = np.random.default_rng(seed)
+    digits = rng.integers(ord("1"), ord("9") + 1, size=(scale, n_batteries + 1), dtype=np.uint8)
+    digits[:, -1] = ord("\n")
+    return digits.tobytes()[:-1]
+
+
+def generate_day_four(scale: int, seed: int = 0, density: float = 0.6) -> bytes:
+    """Generate a SCALE by SCALE grid where a fraction DENSITY of the positions holds a roll."""
+    rng = np.random.default_rng(seed)
+    grid = np.where(rng.random((scale, scale + 1)) < density, ord("@"), ord(".")).astype(np.uint8)
+    grid[:, -1] = ord("\n")
+    return grid.tobytes()[:-1]
+
+
+def generate_day_five(scale: int, seed: int = 0, n_ingredients: int = None) -> bytes:
+    """Generate SCALE fresh ingredient ranges and N_INGREDIENTS (default 10 * SCALE) ingredients."""
+    rng = np.random.default_rng(seed)
+    n_ingredients = 10 * scale if n_ingredients is None else n_ingredients
+    lower = rng.integers(1, 10**15, size=scale)
+    upper = lower + rng.integers(0, 10**11, size=scale)
+    ingredients = rng.integers(1, 10**15, size=n_ingredients)
+
+    ranges = "\n".join(f"{a}-{b}" for a, b in zip(lower.tolist(), upper.tolist()))
+    return (ranges + "\n\n" + "\n".join(map(str, ingredients.tolist()))).encode()
+
+
+def generate_day_six(scale: int, seed: int = 0, n_operands: int = 4, max_digits: int = 4) -> bytes:
+    """Generate a worksheet of SCALE problems with N_OPERANDS numbers of up to MAX_DIGITS digits."""
+    rng = np.random.default_rng(seed)
+    n_digits = rng.integers(1, max_digits + 1, size=(scale, n_operands))
+    numbers = (rng.random((scale, n_operands)) * 9 * 10.0**(n_digits - 1)).astype(np.int64) + 10**(n_digits - 1)
+    operators = rng.choice(["+", "*"], size=scale)
+    right_aligned = rng.random(scale) < 0.5
+
+    # Every problem is a block of equally wide columns, with numbers aligned to either side
+    rows = [[] for _ in range(n_operands + 1)]
+    for i in range(scale):
+        values = [str(x) for x in numbers[i].tolist()]
+        width = max(len(x) for x in values)
+        for j, x in enumerate(values):
+            rows[j].append(x.rjust(width) if right_aligned[i] else x.ljust(width))
+        rows[-1].append(operators[i].ljust(width))
+    return "\n".join(" ".join(row) for row in rows).encode()
+
+
+def generate_day_seven(scale: int, seed: int = 0, width: int = 141, density: float = 0.01, adjacent: bool = False) -> bytes:
+    """Generate a manifold of SCALE rows where a fraction DENSITY of every other row holds a splitter.
+
+    Splitters are only placed next to each other if ADJACENT is set.
+    """
+    rng = np.random.default_rng(seed)
+    manifold = np.full((scale, width + 1), ord("."), dtype=np.uint8)
+    manifold[:, -1] = ord("\n")
+    manifold[0, width // 2] = ord("S")
+
+    # Splitters are placed on every other row and never at the edges
+    splitters = rng.random((scale, width)) < density
+    splitters[::2] = False
+    splitters[:, [0, -1]] = False
+    if not adjacent:
+        splitters[:, 1:] &= ~splitters[:, :-1]
+    manifold[:, :-1][splitters] = ord("^")
+    return manifold.tobytes()[:-1]
+
+
+GENERATORS = {
+    1: generate_day_one,
+    2: generate_day_two,
+    3: generate_day_three,
+    4: generate_day_four,
+    5: generate_day_five,
+    6: generate_day_six,
+    7: generate_day_seven,
+}
+
+
+def count_items(day: int, scale: int) -> int:
+    """Count the items that the generator of a day generates at the default options for a SCALE.
+
+    The items are rotations, product ranges, battery banks, grid positions, ingredient ranges
+    and ingredients, problems and manifold rows for days 1 to 7.
+    """
+    # Day 4 generates a SCALE by SCALE grid, and day 5 generates 10 ingredients per range
+    if day == 4:
+        return scale**2
+    if day == 5:
+        return 11 * scale
+    return scale
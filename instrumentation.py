@@ -0,0 +1,108 @@
+"""Module for timing and memory instrumentation of the phases of a solution."""
+
+import json
+import logging
+import time
+import tracemalloc
+
+from contextlib import ContextDecorator
+
+from log import setup_json_logging
+
+
+LOGGER_NAME = "instrumentation"
+
+# All finished spans of this process, and the spans that are currently open (innermost last)
+records = []
+_open_spans = []
+_emit = False
+
+
+def setup_instrumentation(file_path: str = None, memory: bool = False):
+    """Emit every finished span as a JSON line to stderr or a file, and optionally trace memory."""
+    global _emit
+    setup_json_logging(LOGGER_NAME, file_path)
+    _emit = True
+
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+class span(ContextDecorator):
+    """Measure the wall time and peak traced memory of a block of code or a function."""
+
+    def __init__(self, name: str, **fields):
+        """Create a span with a NAME and extra FIELDS (e.g. day and part) to report with it."""
+        self.name = name
+        self.fields = fields
+
+    def _recreate_cm(self):
+        """Use a fresh span for every call of a decorated function."""
+        return span(self.name, **self.fields)
+
+    def set(self, **fields):
+        """Add fields to report with the span, e.g. whether a cache was hit."""
+        self.fields.update(fields)
+
+    def __enter__(self):
+        # Peaks are measured by resetting the peak of tracemalloc. Save the peak of the enclosing
+        # span first, so it can include the peak of this span and the memory it used before.
+        self.memory_start = None
+        if tracemalloc.is_tracing():
+            self.memory_start, outer_peak = tracemalloc.get_traced_memory()
+            if _open_spans:
+                _open_spans[-1].peak = max(_open_spans[-1].peak, outer_peak)
+            tracemalloc.reset_peak()
+        self.peak = 0
+
+        _open_spans.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        _open_spans.pop()
+
+        peak_memory = None
+        if self.memory_start is not None and tracemalloc.is_tracing():
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            peak_memory = self.peak - self.memory_start
+            if _open_spans:
+                _open_spans[-1].peak = max(_open_spans[-1].peak, self.peak)
+
+        emit({
+            "span": self.name,
+            **self.fields,
+            "duration_ns": duration_ns,
+            "peak_memory_bytes": peak_memory,
+            "status": "ok" if exc_type is None else "error",
+        })
+        return False
+
+
+def annotate(**fields):
+    """Add fields to report with the innermost open span, if any, e.g. from code that does not own it."""
+    if _open_spans:
+        _open_spans[-1].set(**fields)
+
+
+def emit(record: dict):
+    """Keep a finished span and write it as a JSON line if enabled, e.g. for spans from another process."""
+    records.append(record)
+    if _emit:
+        logging.getLogger(LOGGER_NAME).info(json.dumps(record))
+
+
+def format_summary(spans: list = None) -> str:
+    """Format the finished spans as a table."""
+    spans = records if spans is None else spans
+    lines = [f"{'span':<12} {'day':>3} {'part':>4} {'milliseconds':>13} {'peak MB':>9}  other"]
+    for record in spans:
+        other = {k: v for k, v in record.items() if k not in ("span", "day", "part", "duration_ns", "peak_memory_bytes")}
+        peak = record["peak_memory_bytes"]
+        lines.append(
+            f"{record['span']:<12} {record.get('day', ''):>3} {record.get('part', ''):>4} "
+            f"{record['duration_ns'] / 1e6:>13.3f} {'' if peak is None else f'{peak / 1e6:.2f}':>9}  "
+            + " ".join(f"{k}={v}" for k, v in other.items())
+        )
+    return "\n".join(lines)
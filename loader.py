@@ -0,0 +1,110 @@
+"""Module for loading puzzle input without copying it."""
+
+import mmap
+import os
+import re
+import sys
+
+from typing import Iterator
+
+
+DEFAULT_INPUT_DIR = "../inputs"
+
+NEWLINE = re.compile(rb"\n")
+BLANK_LINES = re.compile(rb"\r?\n(?:[ \t]*\r?\n)+")
+
+
+def resolve_input_path(day: int, file_path: str = None) -> str:
+    """Find the puzzle input file of a day, unless a file path is given explicitly."""
+    if file_path is not None:
+        return file_path
+
+    # The directory can be overridden through the environment, e.g. to run from another directory
+    input_dir = os.environ.get("AOC_INPUT_DIR", DEFAULT_INPUT_DIR)
+    return os.path.join(input_dir, f"day{day}.txt")
+
+
+def load_puzzle_input(day: int, file_path: str = None) -> memoryview:
+    """Memory-map the puzzle input of a day, or read it from stdin if the file path is "-"."""
+    if file_path == "-":
+        return memoryview(sys.stdin.buffer.read())
+
+    with open(resolve_input_path(day, file_path), "rb") as file:
+        # Empty files cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return memoryview(b"")
+
+        # The mapping stays valid after closing the file, and is released together with the view
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped)
+
+
+def load_puzzle_text(day: int, file_path: str = None) -> str:
+    """Load the puzzle input of a day decoded as text."""
+    return str(load_puzzle_input(day, file_path), "utf-8")
+
+
+def iter_lines(buffer: memoryview) -> Iterator[memoryview]:
+    """Iterate over the lines of a buffer as views, without line endings and a final empty line."""
+    buffer = memoryview(buffer)
+    start = 0
+    for match in NEWLINE.finditer(buffer):
+        end = match.start()
+        if end > start and buffer[end-1] == ord("\r"):
+            end -= 1
+        yield buffer[start:end]
+        start = match.end()
+
+    if start < len(buffer):
+        yield buffer[start:]
+
+
+def split_sections(buffer: memoryview) -> list:
+    """Split a buffer into views of the sections that are separated by blank lines."""
+    buffer = memoryview(buffer)
+    sections = []
+    start = 0
+    for match in BLANK_LINES.finditer(buffer):
+        sections.append(buffer[start:match.start()])
+        start = match.end()
+
+    sections.append(buffer[start:])
+    return sections
+
+
+def find_row_layout(buffer: memoryview) -> tuple:
+    """Find the number of rows, the width and the stride in bytes of a buffer of equally long lines.
+
+    Lines end with either "\n" or "\r\n", which is not part of the width but is part of the stride.
+    Raises a ValueError if the lines do not all have the same length and line ending.
+    """
+    buffer = memoryview(buffer)
+    first_newline = NEWLINE.search(buffer)
+    if first_newline is None:
+        return 1, len(buffer), len(buffer) + 1
+    stride = first_newline.end()
+    ending = 2 if stride >= 2 and buffer[stride-2] == ord("\r") else 1
+
+    # Every row is followed by a line ending, except possibly the last row. So the line endings
+    # must be exactly at the ends of the rows, and nowhere else.
+    n_rows = (len(buffer) + ending) // stride
+    newlines = bytes(buffer[stride-1::stride])
+    returns = bytes(buffer[stride-2::stride]) if ending == 2 else b""
+    if (
+        len(buffer) not in (n_rows * stride, n_rows * stride - ending)
+        or newlines.count(b"\n") != len(newlines)
+        or returns.count(b"\r") != len(returns)
+        or len(NEWLINE.findall(buffer)) != len(newlines)
+    ):
+        raise ValueError("Lines of the puzzle input do not all have the same length.")
+    return n_rows, stride - ending, stride
+
+
+def view_as_rows(buffer: memoryview):
+    """View a buffer of equally long lines as a 2-D uint8 array of characters, without copying."""
+    import numpy as np
+
+    # View the raw bytes as rows of STRIDE bytes, skipping the line ending at the end of each row
+    n_rows, width, stride = find_row_layout(buffer)
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    return np.lib.stride_tricks.as_strided(raw, shape=(n_rows, width), strides=(stride, 1))
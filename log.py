@@ -11,6 +11,22 @@ def setup_logging(log_level: int = logging.INFO):
 
     logging.basicConfig(
         level=log_level,
-        format="%(asctime)s|%(levelname)s|%(name)s|%(message)s",
+        format="%(asctime)s.%(msecs)03d|%(levelname)s|%(name)s|%(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+
+
+def setup_json_logging(logger_name: str, file_path: str = None) -> logging.Logger:
+    """Set up a logger that writes bare messages (e.g. JSON lines) to stderr or a file."""
+    logger = logging.getLogger(logger_name)
+    if file_path is None or file_path == "-":
+        handler = logging.StreamHandler()
+    else:
+        handler = logging.FileHandler(file_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Do not pass the messages on to the root logger, they have their own format
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
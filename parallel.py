@@ -0,0 +1,62 @@
+"""Module for sharding the work of a solution over processes, sharing the input through shared memory."""
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+
+# Starting a pool of workers costs in the order of 100 ms, so every chunk should at least take
+# about as long. Each solution defines how many items it processes in that time.
+CHUNKS_PER_WORKER = 4
+
+
+def choose_chunks(n_items: int, min_items_per_chunk: int, max_workers: int = None) -> list:
+    """Split N_ITEMS into contiguous (start, stop) chunks, or a single chunk if not worth sharding."""
+    n_workers = max_workers or os.cpu_count() or 1
+    n_chunks = min(n_workers * CHUNKS_PER_WORKER, n_items // max(min_items_per_chunk, 1))
+    if n_workers == 1 or n_chunks <= 1:
+        return [(0, n_items)]
+
+    # Only the choice of the chunks is needed to decide whether to shard, so it does not need NumPy
+    bounds = [i * n_items // n_chunks for i in range(n_chunks + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+@contextmanager
+def share_array(array):
+    """Copy a NumPy array into shared memory and yield the descriptor that workers use to attach to it."""
+    import numpy as np
+
+    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+        yield (memory.name, array.shape, array.dtype.str)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+@contextmanager
+def attach_array(descriptor: tuple):
+    """Attach to an array in shared memory without copying it.
+
+    Workers share the resource tracker of the process that created the shared memory,
+    so the shared memory is only removed once that process is done with it.
+    """
+    import numpy as np
+
+    name, shape, dtype = descriptor
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        yield np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf)
+    finally:
+        memory.close()
+
+
+def map_chunks(function, array, chunks: list, *args, max_workers: int = None) -> list:
+    """Call FUNCTION(descriptor, start, stop, *ARGS) for every chunk of a shared array in a process pool."""
+    with share_array(array) as descriptor, ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(function, descriptor, start, stop, *args) for start, stop in chunks]
+        return [future.result() for future in futures]
@@ -0,0 +1,83 @@
+"""Module for profiling solutions with a stack sampler or cProfile."""
+
+import cProfile
+import os
+import sys
+import threading
+
+from collections import Counter
+from contextlib import contextmanager
+
+
+class StackSampler:
+    """Sample the call stack of a thread at a fixed interval from a background thread."""
+
+    def __init__(self, interval: float = 0.001, thread_id: int = None):
+        """Create a sampler of the given thread, by default the thread that creates it."""
+        self.interval = interval
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.samples = Counter()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        """Record the collapsed stack of the sampled thread until stopped."""
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            # Collapsed stacks list the frames from the outermost to the innermost call
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        """Start sampling in a background thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the background thread."""
+        self._stopped.set()
+        self._thread.join()
+
+    def write_collapsed(self, file_path: str):
+        """Write the samples in the collapsed stack format used by flamegraph tools."""
+        with open(file_path, "w") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profile(file_path: str, mode: str = "sample", interval: float = 0.001):
+    """Profile a block of code and write the result to FILE_PATH with a mode-specific extension.
+
+    The "sample" mode writes collapsed stacks (.collapsed) and has low overhead. The "cprofile"
+    mode is deterministic and writes pstats output (.prof).
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if mode == "sample":
+        sampler = StackSampler(interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            sampler.write_collapsed(file_path + ".collapsed")
+    elif mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(file_path + ".prof")
+    else:
+        raise ValueError(f"Unknown profiling mode: {mode}.")
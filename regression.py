@@ -0,0 +1,310 @@
+"""Module for checking the optimised solutions against reference solutions and timing baselines."""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+
+from aoc import PUZZLES, call_solver, import_day, parse_puzzle_input, solve_part
+from benchmark import measure_phases
+from generators import GENERATORS
+from log import setup_logging
+
+
+# Input sizes that the reference solutions can still solve quickly, and generator options to match
+REFERENCE_SCALES = {1: 2000, 2: 50, 3: 200, 4: 40, 5: 300, 6: 300, 7: 400}
+REFERENCE_OPTIONS = {2: {"max_digits": 8, "max_width": 2000}, 7: {"density": 0.3, "adjacent": True}}
+
+# Input sizes at which the optimised solutions are timed against the baseline
+TIMING_SCALES = {1: 10**6, 2: 10**4, 3: 10**5, 4: 1000, 5: 10**5, 6: 10**5, 7: 10**5}
+
+
+def reference_day_one(text: str) -> dict:
+    """Solve day 1 with the original solvers."""
+    import day1
+    rotations = day1.convert_input_to_rotations(text.split())
+    return {part: solver(50, rotations) for part, solver in [
+        (1, day1.solve_day_one_part_one), (2, day1.solve_day_one_part_two)]}
+
+
+def reference_day_two(text: str) -> dict:
+    """Solve day 2 with the original per-integer checks."""
+    import day2
+    input = text.replace("\n","").split(",")
+    return {1: day2.solve_day_two_part_one(input), 2: day2.solve_day_two_part_two(input)}
+
+
+def reference_day_three(text: str) -> dict:
+    """Solve day 3 with the original full and skip searches."""
+    import day3
+    input = text.split("\n")
+    return {1: day3.solve_day_three_part_one(input), 2: day3.solve_day_three_part_two(input)}
+
+
+def reference_day_four(text: str) -> dict:
+    """Solve day 4 by counting neighbours of every position in plain Python, round by round."""
+    grid = [[c == "@" for c in line] for line in text.split("\n")]
+    n_rows, n_columns = len(grid), len(grid[0])
+
+    def accessible() -> list:
+        result = []
+        for i in range(n_rows):
+            for j in range(n_columns):
+                neighbours = sum(
+                    grid[i+v][j+h]
+                    for v in [-1,0,1] for h in [-1,0,1]
+                    if (v, h) != (0, 0) and 0 <= i+v < n_rows and 0 <= j+h < n_columns
+                )
+                if grid[i][j] and neighbours < 4:
+                    result.append((i, j))
+        return result
+
+    rolls = accessible()
+    solutions = {1: len(rolls), 2: 0}
+    while rolls:
+        solutions[2] += len(rolls)
+        for i, j in rolls:
+            grid[i][j] = False
+        rolls = accessible()
+    return solutions
+
+
+def reference_day_five(text: str) -> dict:
+    """Solve day 5 by checking every range for every ingredient and merging ranges in plain Python."""
+    ranges_raw, ingredients_raw = text.split("\n\n")
+    ranges = sorted(tuple(map(int, x.split("-"))) for x in ranges_raw.split("\n"))
+    ingredients = [int(x) for x in ingredients_raw.split("\n")]
+
+    merged = [list(ranges[0])]
+    for lower, upper in ranges[1:]:
+        if lower <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], upper)
+        else:
+            merged.append([lower, upper])
+
+    return {
+        1: sum(any(lower <= x <= upper for lower, upper in ranges) for x in ingredients),
+        2: sum(upper - lower + 1 for lower, upper in merged),
+    }
+
+
+def reference_day_six(text: str) -> dict:
+    """Solve day 6 with the original solvers."""
+    import day6
+    input = text.split("\n")
+    return {1: day6.solve_day_six_part_one(input), 2: day6.solve_day_six_part_two(input)}
+
+
+def reference_day_seven(text: str) -> dict:
+    """Solve day 7 by moving the paths of every column down row by row in plain Python."""
+    # The original solvers move paths on to a splitter next to a hit splitter within the same
+    # row, so they cannot be compared on manifolds with splitters next to each other
+    input = text.split("\n")
+    paths = [int(x == "S") for x in input[0]]
+    solutions = {1: 0, 2: 0}
+    for line in input[1:]:
+        moved = [0] * len(paths)
+        for c, n in enumerate(paths):
+            if n > 0 and line[c] == "^":
+                solutions[1] += 1
+                moved[c-1] += n
+                moved[c+1] += n
+            else:
+                moved[c] += n
+        paths = moved
+    solutions[2] = sum(paths)
+    return solutions
+
+
+REFERENCES = {
+    1: reference_day_one,
+    2: reference_day_two,
+    3: reference_day_three,
+    4: reference_day_four,
+    5: reference_day_five,
+    6: reference_day_six,
+    7: reference_day_seven,
+}
+
+
+def check_day_one_batched(text: str, expected: dict) -> list:
+    """Check the batched day 1 counts against the original solvers for many logs and starting values."""
+    import day1
+    rotations = day1.convert_input_to_rotations(text.split())
+    logs = [rotations[:300], [], rotations[300:301], rotations[301:700], rotations[700:1000]]
+    starting_values = list(range(-250, 251, 17)) + [-1050, -100, -1, 0, 99, 100, 1234]
+    part_one, part_two = day1.count_dial_zeros_batched(starting_values, logs)
+
+    failures = []
+    for i, log in enumerate(logs):
+        for j, starting_value in enumerate(starting_values):
+            for part, solver, answer in [(1, day1.solve_day_one_part_one, part_one), (2, day1.solve_day_one_part_two, part_two)]:
+                if answer[i, j] != solver(starting_value, log):
+                    failures.append(
+                        f"batched part {part} of log {i} from {starting_value}: "
+                        f"expected {solver(starting_value, log)}, got {answer[i, j]}."
+                    )
+    return failures
+
+
+def check_day_two_sharding(text: str, expected: dict) -> list:
+    """Check the sharded day 2 solver, forcing it to shard the few product ranges over two workers."""
+    import day2
+    input = text.replace("\n","").split(",")
+    failures = []
+    for part in [1, 2]:
+        answer = day2.solve_day_two_parallel(input, part == 2, max_workers=2, min_items_per_chunk=1)
+        if answer != expected[part]:
+            failures.append(f"sharded part {part}: expected {expected[part]}, got {answer}.")
+    return failures
+
+
+def check_day_two_table(text: str, expected: dict) -> list:
+    """Check the day 2 table solver against the closed-form sums, with ranges across the limit of the table."""
+    import day2
+    input = text.replace("\n","").split(",")
+
+    # The generated product IDs go up to 8 digits, so a table of 6 digits is crossed by some ranges
+    max_digits = 6
+    limit = 10**max_digits - 1
+    input += [f"{limit - width}-{limit + width}" for width in [0, 1, 10, 1000, 10**5]] + [f"{limit + 1}-{limit + 1}"]
+
+    failures = []
+    for approximate in [False, True]:
+        sum_repetitive = day2.sum_approximately_repetitive if approximate else day2.sum_strictly_repetitive
+        expected_sum = sum(sum_repetitive(*day2.get_product_range(x)) for x in input)
+        answer = day2.solve_day_two_with_table(input, day2.RepetitiveIdTable.build(max_digits, approximate))
+        if answer != expected_sum:
+            failures.append(f"table part {2 if approximate else 1}: expected {expected_sum}, got {answer}.")
+    return failures
+
+
+def check_day_three_sharding(text: str, expected: dict) -> list:
+    """Check the sharded day 3 solver, forcing it to shard the few battery banks over two workers."""
+    import day3
+    banks = day3.transform_input_into_banks(memoryview(text.encode()))
+    failures = []
+    for part, n_choose in [(1, 2), (2, 12)]:
+        answer = day3.solve_day_three_parallel(banks, n_choose, max_workers=2, min_items_per_chunk=1)
+        if answer != expected[part]:
+            failures.append(f"sharded part {part}: expected {expected[part]}, got {answer}.")
+    return failures
+
+
+def check_day_three_joltage_table(text: str, expected: dict) -> list:
+    """Check the day 3 joltage tables against the stack search for every number of batteries to choose."""
+    import day3
+    # A table takes a search per number of batteries, so only check the first banks
+    banks = text.split("\n")[:20]
+    failures = []
+    for bank, table in zip(banks, day3.tabulate_maximum_joltage(banks)):
+        for n_choose in range(1, len(bank) + 1):
+            answer = day3.find_maximum_joltage(bank, n_choose)
+            if table[n_choose] != answer:
+                failures.append(f"joltage table of {bank} for {n_choose} batteries: expected {answer}, got {table[n_choose]}.")
+    return failures
+
+
+# Checks of solvers that the reference scales do not reach or that the registry does not use.
+# Each check compares them on the generated input and returns the descriptions of the differences.
+CHECKS = {
+    1: [check_day_one_batched],
+    2: [check_day_two_sharding, check_day_two_table],
+    3: [check_day_three_sharding, check_day_three_joltage_table],
+}
+
+
+def write_input(directory: str, day: int, input_raw: bytes) -> str:
+    """Write generated puzzle input to a file and return its path."""
+    file_path = os.path.join(directory, f"day{day}.txt")
+    with open(file_path, "wb") as file:
+        file.write(input_raw)
+    return file_path
+
+
+def check_answers(day: int, seeds: list) -> list:
+    """Compare the answers of the optimised and reference solutions on generated input."""
+    puzzle, module = import_day(day)
+    failures = []
+    for seed in seeds:
+        input_raw = GENERATORS[day](REFERENCE_SCALES[day], seed=seed, **REFERENCE_OPTIONS.get(day, {}))
+        expected = REFERENCES[day](input_raw.decode())
+
+        with tempfile.TemporaryDirectory() as directory:
+            input = module.read_puzzle_input(write_input(directory, day, input_raw))
+            arguments = parse_puzzle_input(puzzle, module, input)
+            for part in puzzle.parts:
+                answer = solve_part(puzzle, module, arguments, part)
+                if answer != expected[part]:
+                    failures.append(f"Day {day} part {part} (seed {seed}): expected {expected[part]}, got {answer}.")
+
+            # The solver of both parts is used instead of the solvers of the parts when solving a whole day
+            if puzzle.both is not None:
+                answers = tuple(call_solver(puzzle.both, module, arguments))
+                if answers != (expected[1], expected[2]):
+                    failures.append(f"Day {day} both parts (seed {seed}): expected {(expected[1], expected[2])}, got {answers}.")
+
+        for check in CHECKS.get(day, []):
+            failures += [f"Day {day} (seed {seed}): {failure}" for failure in check(input_raw.decode(), expected)]
+    return failures
+
+
+def measure_time(day: int, repeat: int) -> float:
+    """Measure the best total time of all phases of a day over REPEAT runs."""
+    input_raw = GENERATORS[day](TIMING_SCALES[day])
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = write_input(directory, day, input_raw)
+        return min(sum(measure_phases(day, file_path).values()) for _ in range(repeat))
+
+
+def main(argv: list = None):
+    """Entry point of code."""
+    parser = argparse.ArgumentParser(description="Check the optimised solutions for regressions.")
+    parser.add_argument("--day", type=int, nargs="+", default=sorted(PUZZLES), help="day(s) to check")
+    parser.add_argument("--seeds", type=int, default=3, help="number of generated inputs to compare answers on")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timing runs, the best is kept")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slow-down")
+    parser.add_argument("--baseline", default="regression_baseline.json", help="JSON file with baseline timings")
+    parser.add_argument("--update-baseline", action="store_true", help="store the measured timings as baseline")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    failures = []
+
+    for day in args.day:
+        day_failures = check_answers(day, list(range(args.seeds)))
+        failures += day_failures
+        logging.info(f"Day {day}: answers {'differ' if day_failures else 'match'} on {args.seeds} generated inputs.")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+
+    for day in args.day:
+        seconds = measure_time(day, args.repeat)
+        previous = baseline.get(str(day))
+        if previous is None:
+            logging.info(f"Day {day}: took {seconds:.4f}s, no baseline available.")
+        elif seconds > previous * (1 + args.tolerance) and not args.update_baseline:
+            failures.append(f"Day {day} regressed: took {seconds:.4f}s against a baseline of {previous:.4f}s.")
+        else:
+            logging.info(f"Day {day}: took {seconds:.4f}s against a baseline of {previous:.4f}s.")
+
+        if args.update_baseline:
+            baseline[str(day)] = seconds
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=2)
+        logging.info(f"Saved baseline timings to {args.baseline}.")
+
+    for failure in failures:
+        logging.error(failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()